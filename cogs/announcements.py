@@ -100,18 +100,24 @@ class OwnerNotifier(commands.Cog):
             return
 
         count = 0
-        for entry in announcements.get("channels", []):
-            channel_id = entry.get("channel_id")
-            if channel_id:
-                channel = self.bot.get_channel(channel_id)
-                if channel:
-                    try:
-                        await channel.send(message)
-                        count += 1
-                        await asyncio.sleep(10)  
-                    except Exception as e:
-                        print(f"Failed to send message to channel {channel_id}: {e}")
-        await ctx.send(f"Announcement sent to {count} channel(s).")
+        channel_ids = [entry.get("channel_id") for entry in announcements.get("channels", []) if entry.get("channel_id")]
+        listing = self.bot.get_cog("ListCog")
+        registry = listing.channels if listing is not None else None
+        if registry is not None:
+            channels = await registry.resolve_many(channel_ids)
+        else:
+            channels = [channel for channel in map(self.bot.get_channel, channel_ids) if channel is not None]
+        for channel in channels:
+            try:
+                await channel.send(message)
+                count += 1
+                await asyncio.sleep(10)  
+            except Exception as e:
+                if registry is not None:
+                    registry.mark_failed(channel.id, e)
+                print(f"Failed to send message to channel {channel.id}: {e}")
+        skipped = len(channel_ids) - len(channels)
+        await ctx.send(f"Announcement sent to {count} channel(s)." + (f" Skipped {skipped} unreachable channel(s)." if skipped else ""))
 
 class OwnerAskView(discord.ui.View):
     def __init__(self, owner: discord.User, guild: discord.Guild, bot: commands.Bot, timeout: float = 300):
@@ -8,12 +8,13 @@ import re
 import random
 import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Tuple, List, Set
 
 GIVEAWAY_FILE = "/home/container/giveaways.json"
 ADMIN_FILE = "/home/container/admin.json"
 MAIN_SERVER_ID = 1310977344076251176
 ANNOUNCE_LOG_CHANNEL_ID = 1330577417496035409  
+ENTRY_UPDATE_INTERVAL = 5
 
 def load_json(filepath: str) -> Dict[str, Any]:
     if os.path.exists(filepath):
@@ -47,6 +48,82 @@ class Giveaway(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.giveaway_task: Optional[asyncio.Task] = None
+        self.invite_codes: Optional[Dict[str, Tuple[Optional[int], int]]] = None
+        self.invite_totals: Dict[int, int] = {}
+        self.invite_fetch: Optional[asyncio.Task] = None
+        self.invites_stale = False
+        self.joined_users: Set[int] = set()
+        self.joined_for: Optional[int] = None
+        self.giveaway_message: Optional[discord.Message] = None
+        self.entry_count = 0
+        self.entry_update_task: Optional[asyncio.Task] = None
+        self.last_entry_update = 0.0
+
+    async def cog_load(self):
+        if self.load_giveaway():
+            guild = self.bot.get_guild(MAIN_SERVER_ID)
+            if guild:
+                asyncio.create_task(self.refresh_invites(guild))
+
+    def apply_invites(self, invites: List[discord.Invite]):
+        codes = {}
+        totals: Dict[int, int] = {}
+        for invite in invites:
+            inviter_id = invite.inviter.id if invite.inviter else None
+            codes[invite.code] = (inviter_id, invite.uses or 0)
+            if inviter_id is not None:
+                totals[inviter_id] = totals.get(inviter_id, 0) + (invite.uses or 0)
+        self.invite_codes = codes
+        self.invite_totals = totals
+
+    async def fetch_invites(self, guild: discord.Guild):
+        while self.invites_stale:
+            self.invites_stale = False
+            try:
+                invites = await guild.invites()
+            except Exception as e:
+                print("Error fetching guild invites:", e)
+                return
+            self.apply_invites(invites)
+
+    async def refresh_invites(self, guild: discord.Guild):
+        
+        self.invites_stale = True
+        if self.invite_fetch is None or self.invite_fetch.done():
+            self.invite_fetch = asyncio.create_task(self.fetch_invites(guild))
+        await asyncio.shield(self.invite_fetch)
+
+    async def invite_uses(self, guild: discord.Guild, user_id: int) -> int:
+        if self.invite_codes is None:
+            await self.refresh_invites(guild)
+        return self.invite_totals.get(user_id, 0)
+
+    def update_invite(self, code: str, inviter_id: Optional[int], uses: int):
+        previous_inviter, previous_uses = self.invite_codes.pop(code, (None, 0))
+        if previous_inviter is not None:
+            self.invite_totals[previous_inviter] = self.invite_totals.get(previous_inviter, 0) - previous_uses
+        if inviter_id is not None and uses >= 0:
+            self.invite_codes[code] = (inviter_id, uses)
+            self.invite_totals[inviter_id] = self.invite_totals.get(inviter_id, 0) + uses
+
+    @commands.Cog.listener()
+    async def on_invite_create(self, invite: discord.Invite):
+        if self.invite_codes is None or not (invite.guild and invite.guild.id == MAIN_SERVER_ID):
+            return
+        self.update_invite(invite.code, invite.inviter.id if invite.inviter else None, invite.uses or 0)
+
+    @commands.Cog.listener()
+    async def on_invite_delete(self, invite: discord.Invite):
+        if self.invite_codes is None or not (invite.guild and invite.guild.id == MAIN_SERVER_ID):
+            return
+        self.update_invite(invite.code, None, -1)
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        
+        if self.invite_codes is None or member.guild.id != MAIN_SERVER_ID:
+            return
+        await self.refresh_invites(member.guild)
 
     def load_giveaway(self) -> Dict[str, Any]:
         return load_json(GIVEAWAY_FILE)
@@ -56,6 +133,41 @@ class Giveaway(commands.Cog):
 
     def delete_giveaway(self) -> None:
         delete_json(GIVEAWAY_FILE)
+        self.invite_codes = None
+        self.invite_totals = {}
+        self.joined_users = set()
+        self.joined_for = None
+
+    def joined_set(self, giveaway_data: Dict[str, Any]) -> Set[int]:
+        if self.joined_for != giveaway_data.get("message_id"):
+            self.joined_users = {entry["user_id"] for entry in giveaway_data.get("entries", [])}
+            self.joined_for = giveaway_data.get("message_id")
+        return self.joined_users
+
+    def schedule_entry_update(self, giveaway_data: Dict[str, Any], count: int):
+        self.entry_count = count
+        if self.entry_update_task is None or self.entry_update_task.done():
+            self.entry_update_task = asyncio.create_task(self.flush_entry_count(giveaway_data))
+
+    async def flush_entry_count(self, giveaway_data: Dict[str, Any]):
+        
+        shown = None
+        while shown != self.entry_count:
+            delay = self.last_entry_update + ENTRY_UPDATE_INTERVAL - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            shown = self.entry_count
+            self.last_entry_update = time.time()
+            try:
+                if self.giveaway_message is None or self.giveaway_message.id != giveaway_data["message_id"]:
+                    channel = self.bot.get_channel(giveaway_data["channel_id"])
+                    self.giveaway_message = await channel.fetch_message(giveaway_data["message_id"])
+                embed = self.giveaway_message.embeds[0]
+                embed.set_field_at(2, name="Entries", value=str(shown), inline=False)
+                self.giveaway_message = await self.giveaway_message.edit(embed=embed)
+            except Exception as e:
+                print("Error updating giveaway embed:", e)
+                return
 
     def parse_duration(self, duration_str: str) -> int:
         duration_str = duration_str.strip().lower()
@@ -140,6 +252,8 @@ class Giveaway(commands.Cog):
         except ValueError as e:
             await interaction.response.send_message(str(e), ephemeral=True)
             return
+        await interaction.response.defer(ephemeral=True)
+        await self.refresh_invites(interaction.guild)
         end_time = int((datetime.now(timezone.utc) + timedelta(seconds=duration_seconds)).timestamp())
         giveaway_data = {
             "name": name,
@@ -162,7 +276,9 @@ class Giveaway(commands.Cog):
         msg = await channel.send(embed=embed, view=view)
         giveaway_data["message_id"] = msg.id
         self.save_giveaway(giveaway_data)
-        await interaction.response.send_message("Giveaway created successfully.", ephemeral=True)
+        self.giveaway_message = msg
+        self.entry_count = 0
+        await interaction.followup.send("Giveaway created successfully.", ephemeral=True)
         self.giveaway_task = asyncio.create_task(self.wait_and_end_giveaway(giveaway_data))
 
     @giveaway_group.command(name="end", description="End the current giveaway.")
@@ -197,6 +313,7 @@ class Giveaway(commands.Cog):
                 "forced": True
             }
             entries.append(entry)
+            self.joined_set(giveaway_data).add(user.id)
         giveaway_data["entries"] = entries
         self.save_giveaway(giveaway_data)
         await message.channel.send(f"{user.mention} is now forced to win the giveaway.")
@@ -221,6 +338,7 @@ class Giveaway(commands.Cog):
                 "forced": False
             }
             entries.append(entry)
+            self.joined_set(giveaway_data).add(user.id)
         giveaway_data["entries"] = entries
         self.save_giveaway(giveaway_data)
         await message.channel.send(f"{user.mention}'s chance has been set to 0%.")
@@ -239,16 +357,19 @@ class Giveaway(commands.Cog):
             if not giveaway_data:
                 await interaction.response.send_message("No active giveaway found.", ephemeral=True)
                 return
+            if interaction.user.id in self.cog.joined_set(giveaway_data):
+                await interaction.response.send_message("You have already joined this giveaway.", ephemeral=True)
+                return
+            user_invites = await self.cog.invite_uses(interaction.guild, interaction.user.id)
+            giveaway_data = self.cog.load_giveaway()
+            if not giveaway_data:
+                await interaction.response.send_message("No active giveaway found.", ephemeral=True)
+                return
+            joined = self.cog.joined_set(giveaway_data)
+            if interaction.user.id in joined:
+                await interaction.response.send_message("You have already joined this giveaway.", ephemeral=True)
+                return
             entries = giveaway_data.get("entries", [])
-            for entry in entries:
-                if entry["user_id"] == interaction.user.id:
-                    await interaction.response.send_message("You have already joined this giveaway.", ephemeral=True)
-                    return
-            try:
-                invites = await interaction.guild.invites()
-                user_invites = sum(invite.uses for invite in invites if invite.inviter and invite.inviter.id == interaction.user.id)
-            except Exception:
-                user_invites = 0
             uses_data = load_json("/home/container/uses.json")
             bot_uses = uses_data.get(str(interaction.user.id), 0)
             chance = user_invites * 3 + bot_uses * 0.05
@@ -262,21 +383,10 @@ class Giveaway(commands.Cog):
             entries.append(new_entry)
             giveaway_data["entries"] = entries
             self.cog.save_giveaway(giveaway_data)
-            channel = self.cog.bot.get_channel(giveaway_data["channel_id"])
-            try:
-                msg = await channel.fetch_message(giveaway_data["message_id"])
-                embed = msg.embeds[0]
-                
-                current = embed.fields[2].value
-                try:
-                    count = int(current)
-                except Exception:
-                    count = 0
-                count += 1
-                embed.set_field_at(2, name="Entries", value=str(count), inline=False)
-                await msg.edit(embed=embed, view=self)
-            except Exception as e:
-                print("Error updating giveaway embed:", e)
+            joined.add(interaction.user.id)
+            if self.cog.giveaway_message is None and interaction.message and interaction.message.id == giveaway_data.get("message_id"):
+                self.cog.giveaway_message = interaction.message
+            self.cog.schedule_entry_update(giveaway_data, len(entries))
             await interaction.response.send_message("You have joined the giveaway!", ephemeral=True)
 
     @commands.Cog.listener()
@@ -1,13 +1,24 @@
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord import app_commands
+import aiohttp
+import asyncio
+import csv
 import json
 import os
 import re
+import tempfile
 from datetime import datetime, timezone
-from typing import Optional, List
+from typing import Optional, List, Dict
 
 INVESTMENTS_FILE = "/home/container/investments.json"
+QUOTAS_FILE = "/home/container/quotas.json"
+ALERTS_FILE = "/home/container/investmentalerts.json"
+ALERT_DM_INTERVAL = 2
+MAX_ALERTS_PER_USER = 10
+IMPORT_MAX_BYTES = 1024 * 1024
+IMPORT_MAX_ROWS = 5000
+IMPORT_BATCH_SIZE = 200
 USES_FILE = "/home/container/uses.json"
 BLACKLIST_FILE = "/home/container/blacklist.json"
 VALUES_FILE = "/home/container/cogs/values.json"
@@ -25,20 +36,98 @@ def save_json(filepath: str, data):
     with open(filepath, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=4)
 
+class DailyQuota:
+    
+    def __init__(self, name: str, limit: int, filepath: str = QUOTAS_FILE):
+        self.name = name
+        self.limit = limit
+        self.filepath = filepath
+        
+        self.counters: Dict[str, dict] = load_json(filepath).get(name, {})
+
+    def today(self) -> str:
+        return datetime.now(timezone.utc).date().isoformat()
+
+    def used(self, user_id: str) -> int:
+        counter = self.counters.get(user_id)
+        if counter is None or counter["day"] != self.today():
+            return 0
+        return counter["count"]
+
+    def remaining(self, user_id: str) -> int:
+        return max(self.limit - self.used(user_id), 0)
+
+    def exceeded(self, user_id: str, amount: int = 1) -> bool:
+        return self.used(user_id) + amount > self.limit
+
+    def consume(self, user_id: str, amount: int = 1):
+        today = self.today()
+        counter = self.counters.get(user_id)
+        if counter is None or counter["day"] != today:
+            counter = {"day": today, "count": 0}
+            self.counters[user_id] = counter
+        counter["count"] += amount
+        self.save()
+
+    def refund(self, user_id: str, amount: int = 1):
+        counter = self.counters.get(user_id)
+        if counter is None or counter["day"] != self.today():
+            return
+        counter["count"] = max(counter["count"] - amount, 0)
+        self.save()
+
+    def save(self):
+        
+        today = self.today()
+        self.counters = {user_id: counter for user_id, counter in self.counters.items() if counter["day"] == today}
+        data = load_json(self.filepath)
+        data[self.name] = self.counters
+        save_json(self.filepath, data)
+
 class InvestmentSelectView(discord.ui.View):
     
+    PAGE_SIZE = 5
+
     def __init__(self, investments: List[dict], callback):
         super().__init__(timeout=60)  
         self.investments = investments  
         self.callback = callback  
+        self.page = 0
+        self.page_count = max(1, -(-len(investments) // self.PAGE_SIZE))
+        self.render_page()
 
-        for idx, inv in enumerate(investments[:5], start=1):
-            button = discord.ui.Button(label=str(idx), style=discord.ButtonStyle.primary)
+    def render_page(self):
+        
+        self.clear_items()
+        start = self.page * self.PAGE_SIZE
+        for idx in range(start, min(start + self.PAGE_SIZE, len(self.investments))):
+            button = discord.ui.Button(label=str(idx + 1), style=discord.ButtonStyle.primary)
             
-            button.custom_id = str(idx)
+            button.custom_id = str(idx + 1)
             
-            button.callback = self.generate_callback(idx - 1)
+            button.callback = self.generate_callback(idx)
             self.add_item(button)
+        if self.page_count > 1:
+            previous_button = discord.ui.Button(label="Previous", style=discord.ButtonStyle.secondary, row=1, disabled=self.page == 0)
+            previous_button.callback = self.generate_page_callback(-1)
+            self.add_item(previous_button)
+            next_button = discord.ui.Button(label="Next", style=discord.ButtonStyle.secondary, row=1, disabled=self.page >= self.page_count - 1)
+            next_button.callback = self.generate_page_callback(1)
+            self.add_item(next_button)
+
+    def build_embed(self) -> discord.Embed:
+        start = self.page * self.PAGE_SIZE
+        desc = "Items:\n"
+        for idx, inv in enumerate(self.investments[start:start + self.PAGE_SIZE], start=start + 1):
+            desc += f"- {idx}. {inv['item']} serial {inv['serial']}\n"
+        embed = discord.Embed(
+            title="Items:",
+            description=desc,
+            color=discord.Color.blue()
+        )
+        if self.page_count > 1:
+            embed.set_footer(text=f"Page {self.page + 1}/{self.page_count}")
+        return embed
 
     def generate_callback(self, index: int):
         async def button_callback(interaction: discord.Interaction):
@@ -46,6 +135,71 @@ class InvestmentSelectView(discord.ui.View):
             self.stop()
         return button_callback
 
+    def generate_page_callback(self, step: int):
+        async def page_callback(interaction: discord.Interaction):
+            self.page = min(max(self.page + step, 0), self.page_count - 1)
+            self.render_page()
+            await interaction.response.edit_message(embed=self.build_embed(), view=self)
+        return page_callback
+
+class InvestmentPageView(discord.ui.View):
+    
+    PAGE_SIZE = 5
+
+    def __init__(self, cog: "Investments", investments: List[dict], summary: dict, show_invite: bool):
+        super().__init__(timeout=180)
+        self.cog = cog
+        self.investments = investments
+        self.summary = summary
+        self.show_invite = show_invite
+        self.page = 0
+        self.page_count = max(1, -(-len(investments) // self.PAGE_SIZE))
+        
+        self.rows: Dict[int, str] = {}
+        self.update_buttons()
+
+    def render_row(self, index: int) -> str:
+        if index not in self.rows:
+            self.rows[index] = self.cog.render_investment_row(self.investments[index])
+        return self.rows[index]
+
+    def build_embed(self) -> discord.Embed:
+        start = self.page * self.PAGE_SIZE
+        end = min(start + self.PAGE_SIZE, len(self.investments))
+        desc = "".join(self.render_row(idx) for idx in range(start, end))
+        embed = discord.Embed(
+            title="Your Investments",
+            description=desc,
+            color=discord.Color.green()
+        )
+        total_cost = self.summary["total_cost"]
+        current_value = self.summary["current_value"]
+        embed.add_field(name="Positions", value=str(self.summary["count"]), inline=True)
+        embed.add_field(name="Total cost", value=self.cog.format_cash(total_cost), inline=True)
+        embed.add_field(name="Current value", value=self.cog.format_cash(current_value), inline=True)
+        embed.add_field(name="Profit/Loss", value=self.cog.format_signed_cash(current_value - total_cost), inline=True)
+        footer = f"Page {self.page + 1}/{self.page_count}"
+        if self.show_invite:
+            footer += " | https://discord.gg/45J959xRzJ"
+        embed.set_footer(text=footer)
+        return embed
+
+    def update_buttons(self):
+        self.previous_page.disabled = self.page == 0
+        self.next_page.disabled = self.page >= self.page_count - 1
+
+    @discord.ui.button(label="Previous", style=discord.ButtonStyle.secondary)
+    async def previous_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page = max(self.page - 1, 0)
+        self.update_buttons()
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+
+    @discord.ui.button(label="Next", style=discord.ButtonStyle.secondary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.page = min(self.page + 1, self.page_count - 1)
+        self.update_buttons()
+        await interaction.response.edit_message(embed=self.build_embed(), view=self)
+
 class Investments(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
@@ -53,14 +207,43 @@ class Investments(commands.Cog):
         if os.path.exists(VALUES_FILE):
             with open(VALUES_FILE, "r", encoding="utf-8") as f:
                 self.values_data = json.load(f)
+            self.values_mtime = os.path.getmtime(VALUES_FILE)
         else:
             self.values_data = {}
+            self.values_mtime = None
 
         self.all_items = []
         for group in ["items", "event_items", "miscellaneous_items", "kukri_items"]:
             if group in self.values_data:
                 self.all_items.extend(list(self.values_data[group].keys()))
 
+        
+        self.summaries: Dict[str, dict] = {}
+        
+        self.item_index: Dict[str, Dict[str, List[int]]] = {}
+        self.daily_quota = DailyQuota("investments", 3)
+        self.import_quota = DailyQuota("investment_imports", 1)
+        for user_id, user_inv in self.load_investments().items():
+            for inv in user_inv:
+                self.track_position(user_id, inv)
+
+        
+        self.alerts: Dict[str, Dict[str, List[int]]] = {}
+        for user_id, user_alerts in load_json(ALERTS_FILE).items():
+            for alert in user_alerts:
+                self.alerts.setdefault(alert["item"], {}).setdefault(user_id, []).append(alert["percent"])
+        self.alert_queue: asyncio.Queue = asyncio.Queue()
+        self.alert_worker: Optional[asyncio.Task] = None
+
+    async def cog_load(self):
+        self.watch_values.start()
+        self.alert_worker = asyncio.create_task(self.send_alert_notifications())
+
+    async def cog_unload(self):
+        self.watch_values.cancel()
+        if self.alert_worker:
+            self.alert_worker.cancel()
+
     def parse_cash(self, cash_str: str) -> int:
         
         cash_str = cash_str.strip().lower()
@@ -86,6 +269,10 @@ class Investments(commands.Cog):
         else:
             return str(amount)
 
+    def format_signed_cash(self, amount: int) -> str:
+        
+        return f"{'+' if amount >= 0 else '-'}{self.format_cash(abs(amount))}"
+
     def parse_price_string(self, price_str: str) -> int:
         
         if "-" in price_str:
@@ -136,6 +323,247 @@ class Investments(commands.Cog):
         else:
             raise ValueError("No price information available.")
 
+    def render_investment_row(self, inv: dict) -> str:
+        
+        item = inv["item"]
+        serial = inv["serial"]
+        buy_value = inv["price"]
+        try:
+            current_value = self.get_item_value(item, serial)
+        except Exception:
+            current_value = 0
+        
+        percent_change = ((current_value - buy_value) / buy_value) * 100 if buy_value != 0 else 0
+        percent_text = f"{'+' if percent_change > 0 else ''}{round(percent_change)}%"
+        
+        category = self.get_item_category(item)
+        serial_text = str(serial) if category in ["items", "kukri_items"] else "No serial"
+        return (f"**Item:** {item}\n"
+                f"**Serial:** {serial_text}\n"
+                f"**Bought for:** {self.format_cash(buy_value)}\n"
+                f"**Current value:** {self.format_cash(current_value)}\n"
+                f"**{'Win' if percent_change>=0 else 'Lose'} (%):** {percent_text}\n\n")
+
+    def position_value(self, item: str, serial: int) -> int:
+        
+        try:
+            return self.get_item_value(item, serial)
+        except Exception:
+            return 0
+
+    def get_summary(self, user_id: str) -> dict:
+        summary = self.summaries.get(user_id)
+        if summary is None:
+            summary = {"count": 0, "total_cost": 0, "current_value": 0, "item_values": {}, "item_costs": {}}
+            self.summaries[user_id] = summary
+        return summary
+
+    def track_position(self, user_id: str, inv: dict):
+        
+        item = inv["item"]
+        value = self.position_value(item, inv["serial"])
+        summary = self.get_summary(user_id)
+        summary["count"] += 1
+        summary["total_cost"] += inv["price"]
+        summary["current_value"] += value
+        summary["item_values"][item] = summary["item_values"].get(item, 0) + value
+        summary["item_costs"][item] = summary["item_costs"].get(item, 0) + inv["price"]
+        self.item_index.setdefault(item, {}).setdefault(user_id, []).append(inv["serial"])
+
+    def untrack_position(self, user_id: str, inv: dict):
+        
+        item = inv["item"]
+        holders = self.item_index.get(item, {})
+        serials = holders.get(user_id, [])
+        if inv["serial"] in serials:
+            serials.remove(inv["serial"])
+        if not serials:
+            holders.pop(user_id, None)
+        if not holders:
+            self.item_index.pop(item, None)
+
+        summary = self.get_summary(user_id)
+        tracked = summary["item_values"].get(item, 0)
+        if user_id not in holders:
+            value = tracked
+        elif item in self.all_items:
+            value = self.position_value(item, inv["serial"])
+        else:
+            value = tracked // (len(serials) + 1)
+        summary["count"] -= 1
+        summary["total_cost"] -= inv["price"]
+        summary["current_value"] -= value
+        if user_id in holders:
+            summary["item_values"][item] = summary["item_values"].get(item, 0) - value
+            summary["item_costs"][item] = summary["item_costs"].get(item, 0) - inv["price"]
+        else:
+            summary["item_values"].pop(item, None)
+            summary["item_costs"].pop(item, None)
+        if summary["count"] <= 0:
+            del self.summaries[user_id]
+
+    def refresh_summaries(self, changed_items: set):
+        
+        for item in changed_items:
+            for user_id, serials in self.item_index.get(item, {}).items():
+                summary = self.summaries[user_id]
+                new_value = sum(self.position_value(item, serial) for serial in serials)
+                summary["current_value"] += new_value - summary["item_values"].get(item, 0)
+                summary["item_values"][item] = new_value
+
+    def reload_values(self) -> Optional[set]:
+        
+        try:
+            with open(VALUES_FILE, "r", encoding="utf-8") as f:
+                new_data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Could not reload values, keeping the previous catalog: {e}")
+            return None
+        if not isinstance(new_data, dict):
+            return None
+        changed_items = set()
+        for group in ["items", "event_items", "miscellaneous_items", "kukri_items"]:
+            old_group = self.values_data.get(group, {})
+            new_group = new_data.get(group, {})
+            for name in old_group.keys() | new_group.keys():
+                if old_group.get(name) != new_group.get(name):
+                    changed_items.add(name)
+        self.values_data = new_data
+        self.all_items = []
+        for group in ["items", "event_items", "miscellaneous_items", "kukri_items"]:
+            if group in self.values_data:
+                self.all_items.extend(list(self.values_data[group].keys()))
+        
+        priced_items = changed_items & set(self.all_items)
+        self.refresh_summaries(priced_items)
+        self.evaluate_alerts(priced_items)
+        return changed_items
+
+    def item_profit_percent(self, user_id: str, item: str) -> Optional[float]:
+        
+        summary = self.summaries.get(user_id)
+        if summary is None or item not in summary["item_costs"]:
+            return None
+        cost = summary["item_costs"][item]
+        if cost == 0:
+            return 0.0
+        return (summary["item_values"][item] - cost) / cost * 100
+
+    @staticmethod
+    def threshold_reached(percent: float, threshold: int) -> bool:
+        return percent >= threshold if threshold >= 0 else percent <= threshold
+
+    def save_alerts(self):
+        data: Dict[str, List[dict]] = {}
+        for item, users in self.alerts.items():
+            for user_id, thresholds in users.items():
+                for threshold in thresholds:
+                    data.setdefault(user_id, []).append({"item": item, "percent": threshold})
+        save_json(ALERTS_FILE, data)
+
+    def discard_alerts(self, user_id: str, item: str):
+        users = self.alerts.get(item)
+        if users and users.pop(user_id, None) is not None:
+            if not users:
+                del self.alerts[item]
+            self.save_alerts()
+
+    def evaluate_alerts(self, changed_items: set):
+        
+        notifications: Dict[str, List[str]] = {}
+        for item in changed_items & self.alerts.keys():
+            holders = self.item_index.get(item, {})
+            users = self.alerts[item]
+            for user_id in list(users):
+                if user_id not in holders:
+                    continue
+                percent = self.item_profit_percent(user_id, item)
+                if percent is None:
+                    continue
+                reached = [threshold for threshold in users[user_id] if self.threshold_reached(percent, threshold)]
+                if not reached:
+                    continue
+                summary = self.summaries[user_id]
+                notifications.setdefault(user_id, []).append(
+                    f"- **{item}** is now {'+' if percent > 0 else ''}{round(percent)}% "
+                    f"(worth {self.format_cash(summary['item_values'][item])}, "
+                    f"bought for {self.format_cash(summary['item_costs'][item])})"
+                )
+                remaining = [threshold for threshold in users[user_id] if threshold not in reached]
+                if remaining:
+                    users[user_id] = remaining
+                else:
+                    del users[user_id]
+            if not users:
+                del self.alerts[item]
+        if notifications:
+            self.save_alerts()
+            for user_id, lines in notifications.items():
+                self.alert_queue.put_nowait((user_id, lines))
+
+    async def send_alert_notifications(self):
+        
+        while True:
+            user_id, lines = await self.alert_queue.get()
+            try:
+                user = self.bot.get_user(int(user_id)) or await self.bot.fetch_user(int(user_id))
+                embed = discord.Embed(
+                    title="Investment Alert <a:success:1337122638388269207>",
+                    description="The values were updated and your alert threshold was reached:\n" + "\n".join(lines),
+                    color=discord.Color.blue()
+                )
+                embed.set_footer(text="https://discord.gg/45J959xRzJ")
+                await user.send(embed=embed)
+            except Exception as e:
+                print(f"Could not send investment alert to {user_id}: {e}")
+            await asyncio.sleep(ALERT_DM_INTERVAL)
+
+    @tasks.loop(seconds=60)
+    async def watch_values(self):
+        if not os.path.exists(VALUES_FILE):
+            return
+        mtime = os.path.getmtime(VALUES_FILE)
+        if mtime != self.values_mtime and self.reload_values() is not None:
+            self.values_mtime = mtime
+
+    def parse_import_row(self, file_format: str, line: str, header: Optional[List[str]]) -> dict:
+        
+        if file_format == "jsonl":
+            row = json.loads(line)
+            if not isinstance(row, dict):
+                raise ValueError("expected a JSON object")
+            return row
+        values = next(csv.reader([line]))
+        return dict(zip(header, (value.strip() for value in values)))
+
+    def validate_import_batch(self, batch: List[tuple], lookup: Dict[str, str]) -> tuple:
+        
+        valid = []
+        errors = []
+        now_iso = datetime.now(timezone.utc).isoformat()
+        for line_no, row in batch:
+            try:
+                item = lookup.get(str(row.get("item", "")).strip().lower())
+                if item is None:
+                    raise ValueError(f"unknown item `{row.get('item')}`")
+                category = self.get_item_category(item)
+                serial = row.get("serial")
+                if serial in (None, ""):
+                    if category in ["items", "kukri_items"]:
+                        raise ValueError("a serial is required for this item")
+                    serial = 0
+                serial = int(serial)
+                purchase_price = self.parse_cash(str(row.get("price", "")))
+                date = row.get("date") or now_iso
+                purchase_date = datetime.fromisoformat(date)
+                if purchase_date.tzinfo is None:
+                    date = purchase_date.replace(tzinfo=timezone.utc).isoformat()
+            except (ValueError, TypeError) as e:
+                errors.append(f"Line {line_no}: {e}")
+                continue
+            valid.append({"item": item, "serial": serial, "date": date, "price": purchase_price})
+        return valid, errors
+
     def load_investments(self) -> dict:
         
         data = load_json(INVESTMENTS_FILE)
@@ -192,12 +620,7 @@ class Investments(commands.Cog):
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        inv_data = self.load_investments()
-        user_inv = inv_data.get(str(interaction.user.id), [])
-
-        today = datetime.now(timezone.utc).date().isoformat()
-        daily_count = sum(1 for inv in user_inv if inv["date"][:10] == today)
-        if daily_count >= 3:
+        if self.daily_quota.exceeded(str(interaction.user.id)):
             await interaction.response.send_message(
                 "To prevent spam we only allow a maximum amount of three daily investments.",
                 ephemeral=True
@@ -220,6 +643,9 @@ class Investments(commands.Cog):
         percentage = (abs(diff) / current_value) * 100 if current_value != 0 else 0
         direction = "higher" if diff > 0 else "lower" if diff < 0 else "equal"
 
+        inv_data = self.load_investments()
+        user_inv = inv_data.get(str(interaction.user.id), [])
+
         now_iso = datetime.now(timezone.utc).isoformat()
         new_inv = {
             "item": item,
@@ -230,6 +656,8 @@ class Investments(commands.Cog):
         user_inv.append(new_inv)
         inv_data[str(interaction.user.id)] = user_inv
         self.save_investments(inv_data)
+        self.track_position(str(interaction.user.id), new_inv)
+        self.daily_quota.consume(str(interaction.user.id))
 
         self.update_investment_uses(str(interaction.user.id))
 
@@ -306,6 +734,9 @@ class Investments(commands.Cog):
             user_inv.remove(chosen_inv)
             inv_data[user_id] = user_inv
             self.save_investments(inv_data)
+            self.untrack_position(user_id, chosen_inv)
+            if user_id not in self.item_index.get(chosen_inv["item"], {}):
+                self.discard_alerts(user_id, chosen_inv["item"])
 
             await inter.response.send_message(embed=embed, ephemeral=True)
 
@@ -314,15 +745,8 @@ class Investments(commands.Cog):
             await finalize_sale(interaction, matching[0])
         else:
             
-            desc = "Items:\n"
-            for idx, inv in enumerate(matching[:5], start=1):
-                desc += f"- {idx}. {inv['item']} serial {inv['serial']}\n"
-            selection_embed = discord.Embed(
-                title="Items:",
-                description=desc,
-                color=discord.Color.blue()
-            )
-            await interaction.response.send_message(embed=selection_embed, ephemeral=True, view=InvestmentSelectView(matching, finalize_sale))
+            select_view = InvestmentSelectView(matching, finalize_sale)
+            await interaction.response.send_message(embed=select_view.build_embed(), ephemeral=True, view=select_view)
 
     @investment.command(name="view", description="View your current investments")
     async def invest_view(self, interaction: discord.Interaction):
@@ -333,35 +757,205 @@ class Investments(commands.Cog):
             await interaction.response.send_message("You have no active investments.", ephemeral=True)
             return
 
+        show_invite = not (interaction.guild and interaction.guild.id == 1310977344076251176)
+        view = InvestmentPageView(self, user_inv, self.get_summary(user_id), show_invite)
+        if view.page_count > 1:
+            await interaction.response.send_message(embed=view.build_embed(), view=view, ephemeral=True)
+        else:
+            await interaction.response.send_message(embed=view.build_embed(), ephemeral=True)
+
+    @investment.command(name="alert", description="Get a DM when one of your investments reaches a profit/loss")
+    @app_commands.describe(item="Select the item to watch", percent="Profit in percent, negative for a loss (e.g. 20 or -10)")
+    @app_commands.autocomplete(item=invest_sell_autocomplete)
+    async def invest_alert(self, interaction: discord.Interaction, item: str, percent: int):
+        user_id = str(interaction.user.id)
+        matched = next((name for name in self.item_index if name.lower() == item.lower() and user_id in self.item_index[name]), None)
+        if matched is None:
+            await interaction.response.send_message("You have no investment in that item.", ephemeral=True)
+            return
+
+        user_alert_count = sum(len(users.get(user_id, [])) for users in self.alerts.values())
+        if user_alert_count >= MAX_ALERTS_PER_USER:
+            await interaction.response.send_message(
+                f"You can only have {MAX_ALERTS_PER_USER} alerts at a time. Remove one with `/investement alertremove`.",
+                ephemeral=True
+            )
+            return
+
+        current = self.item_profit_percent(user_id, matched)
+        if current is not None and self.threshold_reached(current, percent):
+            await interaction.response.send_message(
+                f"`{matched}` is already at {'+' if current > 0 else ''}{round(current)}%.",
+                ephemeral=True
+            )
+            return
+
+        thresholds = self.alerts.setdefault(matched, {}).setdefault(user_id, [])
+        if percent not in thresholds:
+            thresholds.append(percent)
+            self.save_alerts()
+        await interaction.response.send_message(
+            f"You will get a DM once `{matched}` reaches {'+' if percent > 0 else ''}{percent}%.",
+            ephemeral=True
+        )
+
+    @investment.command(name="alerts", description="View your investment alerts")
+    async def invest_alerts(self, interaction: discord.Interaction):
+        user_id = str(interaction.user.id)
         desc = ""
-        
-        for inv in user_inv[:5]:
-            item = inv["item"]
-            serial = inv["serial"]
-            buy_value = inv["price"]
-            try:
-                current_value = self.get_item_value(item, serial)
-            except Exception:
-                current_value = 0
-            
-            percent_change = ((current_value - buy_value) / buy_value) * 100 if buy_value != 0 else 0
-            percent_text = f"{'+' if percent_change > 0 else ''}{round(percent_change)}%"
-            
-            category = self.get_item_category(item)
-            serial_text = str(serial) if category in ["items", "kukri_items"] else "No serial"
-            desc += (f"**Item:** {item}\n"
-                     f"**Serial:** {serial_text}\n"
-                     f"**Bought for:** {self.format_cash(buy_value)}\n"
-                     f"**Current value:** {self.format_cash(current_value)}\n"
-                     f"**{'Win' if percent_change>=0 else 'Lose'} (%):** {percent_text}\n\n")
+        for item, users in self.alerts.items():
+            for threshold in users.get(user_id, []):
+                desc += f"- **{item}** at {'+' if threshold > 0 else ''}{threshold}%\n"
+        if not desc:
+            await interaction.response.send_message("You have no investment alerts.", ephemeral=True)
+            return
         embed = discord.Embed(
-            title="Your Investments",
+            title="Your Investment Alerts",
             description=desc,
-            color=discord.Color.green()
+            color=discord.Color.blue()
         )
-        if not (interaction.guild and interaction.guild.id == 1310977344076251176):
-            embed.set_footer(text="https://discord.gg/45J959xRzJ")
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
+    @investment.command(name="alertremove", description="Remove your alerts for an item")
+    @app_commands.describe(item="Select the item")
+    @app_commands.autocomplete(item=invest_sell_autocomplete)
+    async def invest_alert_remove(self, interaction: discord.Interaction, item: str):
+        user_id = str(interaction.user.id)
+        matched = next((name for name in self.alerts if name.lower() == item.lower() and user_id in self.alerts[name]), None)
+        if matched is None:
+            await interaction.response.send_message("No alert found for that item.", ephemeral=True)
+            return
+        self.discard_alerts(user_id, matched)
+        await interaction.response.send_message(f"Removed your alerts for `{matched}`.", ephemeral=True)
+
+    @investment.command(name="import", description="Import investments from a CSV or JSONL file")
+    @app_commands.describe(file="CSV with the columns item, serial, price, date (optional) or JSONL with the same keys")
+    async def invest_import(self, interaction: discord.Interaction, file: discord.Attachment):
+        user_id = str(interaction.user.id)
+        blacklist = load_json(BLACKLIST_FILE)
+        if user_id in blacklist:
+            await interaction.response.send_message("You are blacklisted.", ephemeral=True)
+            return
+
+        filename = file.filename.lower()
+        if filename.endswith(".csv"):
+            file_format = "csv"
+        elif filename.endswith(".jsonl"):
+            file_format = "jsonl"
+        else:
+            await interaction.response.send_message("Please upload a `.csv` or `.jsonl` file.", ephemeral=True)
+            return
+        if file.size > IMPORT_MAX_BYTES:
+            await interaction.response.send_message("The file is too large (max 1MB).", ephemeral=True)
+            return
+        if self.import_quota.exceeded(user_id):
+            await interaction.response.send_message("You can only import investments once per day.", ephemeral=True)
+            return
+        self.import_quota.consume(user_id)
+
+        await interaction.response.defer(ephemeral=True)
+
+        lookup = {name.lower(): name for name in self.all_items}
+        imported = []
+        errors = []
+        batch = []
+        header = None
+        line_no = 0
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.get(file.url) as resp:
+                    resp.raise_for_status()
+                    async for raw_line in resp.content:
+                        line_no += 1
+                        line = raw_line.decode("utf-8-sig").strip()
+                        if not line:
+                            continue
+                        if file_format == "csv" and header is None:
+                            header = [column.strip().lower() for column in next(csv.reader([line]))]
+                            if "item" not in header or "price" not in header:
+                                self.import_quota.refund(user_id)
+                                await interaction.followup.send("The CSV header must contain at least `item` and `price`.", ephemeral=True)
+                                return
+                            continue
+                        if len(imported) + len(batch) >= IMPORT_MAX_ROWS:
+                            errors.append(f"Stopped after {IMPORT_MAX_ROWS} rows.")
+                            break
+                        try:
+                            batch.append((line_no, self.parse_import_row(file_format, line, header)))
+                        except (ValueError, StopIteration) as e:
+                            errors.append(f"Line {line_no}: {e}")
+                            continue
+                        if len(batch) >= IMPORT_BATCH_SIZE:
+                            valid, batch_errors = self.validate_import_batch(batch, lookup)
+                            imported.extend(valid)
+                            errors.extend(batch_errors)
+                            batch = []
+        except (aiohttp.ClientError, UnicodeDecodeError) as e:
+            self.import_quota.refund(user_id)
+            await interaction.followup.send(f"Could not read the file: {e}", ephemeral=True)
+            return
+        except ValueError:
+            self.import_quota.refund(user_id)
+            await interaction.followup.send("The file is malformed: a line is too long.", ephemeral=True)
+            return
+        if batch:
+            valid, batch_errors = self.validate_import_batch(batch, lookup)
+            imported.extend(valid)
+            errors.extend(batch_errors)
+
+        if imported:
+            inv_data = self.load_investments()
+            inv_data.setdefault(user_id, []).extend(imported)
+            self.save_investments(inv_data)
+            for inv in imported:
+                self.track_position(user_id, inv)
+            self.update_investment_uses(user_id)
+        else:
+            self.import_quota.refund(user_id)
+
+        embed = discord.Embed(
+            title="Investments Imported" if imported else "Nothing Imported",
+            description=f"Imported {len(imported)} investment(s).",
+            color=discord.Color.green() if imported else discord.Color.red()
+        )
+        if errors:
+            shown = "\n".join(errors[:10])
+            if len(errors) > 10:
+                shown += f"\n... and {len(errors) - 10} more"
+            embed.add_field(name=f"Skipped ({len(errors)})", value=shown[:1024], inline=False)
+        await interaction.followup.send(embed=embed, ephemeral=True)
+
+    @investment.command(name="export", description="Export your investments as a file")
+    @app_commands.describe(file_format="File format of the export")
+    @app_commands.choices(file_format=[
+        app_commands.Choice(name="CSV", value="csv"),
+        app_commands.Choice(name="JSONL", value="jsonl")
+    ])
+    async def invest_export(self, interaction: discord.Interaction, file_format: app_commands.Choice[str]):
+        user_id = str(interaction.user.id)
+        user_inv = self.load_investments().get(user_id, [])
+        if not user_inv:
+            await interaction.response.send_message("You have no active investments.", ephemeral=True)
+            return
+
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", newline="", suffix=f".{file_format.value}", delete=False) as f:
+            path = f.name
+            if file_format.value == "csv":
+                writer = csv.writer(f)
+                writer.writerow(["item", "serial", "price", "date"])
+                for inv in user_inv:
+                    writer.writerow([inv["item"], inv["serial"], inv["price"], inv["date"]])
+            else:
+                for inv in user_inv:
+                    f.write(json.dumps({"item": inv["item"], "serial": inv["serial"], "price": inv["price"], "date": inv["date"]}) + "\n")
+        try:
+            await interaction.response.send_message(
+                f"Exported {len(user_inv)} investment(s).",
+                file=discord.File(path, filename=f"investments.{file_format.value}"),
+                ephemeral=True
+            )
+        finally:
+            os.remove(path)
+
 async def setup(bot: commands.Bot):
     await bot.add_cog(Investments(bot))
@@ -2,19 +2,52 @@ import discord
 from discord import app_commands
 from discord.ext import commands, tasks
 import asyncio
+import functools
+import hashlib
+import heapq
+import itertools
 import json
 import os
 import re
 import random
+import tempfile
+import time
+import zlib
+from collections import deque
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Tuple, Callable, Awaitable, Set, FrozenSet, Iterator
 
 LISTS_FILE = "lists.json"
+LIST_BODIES_DIR = "listbodies"
 SETUP_FILE = "setup.json"
 GUILDCHANNELS_FILE = "guildchannels.json"
 LIST_BLACKLIST_FILE = "listblacklist.json"
 LIST_ALLOWED_FILE = "listallowed.json"
+LIST_DELIVERIES_FILE = "listdeliveries.json"
+VALUES_FILE = "/home/container/cogs/values.json"
 LOGS_CHANNEL_ID = 1330577417496035409
+CHANNEL_SEND_INTERVAL = 1.0
+WEBHOOK_SEND_INTERVAL = 2.0
+LIST_WEBHOOK_NAME = "Trading lists"
+RECENT_MESSAGE_WINDOW = 5
+SEARCH_RESULT_LIMIT = 20
+MATCH_RESULT_LIMIT = 10
+VALUATION_ITEM_LIMIT = 10
+EXPORT_FILE_THRESHOLD = 100
+CHANNEL_CHECK_TTL = 600
+CHANNEL_HEALTH_INTERVAL = 15
+HAVE_KEYWORDS = ("have", "has", "h", "selling", "sell", "offering", "ft", "for trade", "trading")
+WANT_KEYWORDS = ("want", "wants", "w", "buying", "buy", "looking for", "lf", "need", "needs", "iso")
+SIDE_PATTERN = re.compile(
+    r"(?:^|(?<=[\s,;|]))(" + "|".join(sorted((re.escape(k) for k in HAVE_KEYWORDS + WANT_KEYWORDS), key=len, reverse=True)) + r")\s*:|"
+    r"^\W*(" + "|".join(sorted((re.escape(k) for k in HAVE_KEYWORDS + WANT_KEYWORDS if len(k) > 2), key=len, reverse=True)) + r")\b",
+    re.IGNORECASE | re.MULTILINE
+)
+GLOBAL_SENDS_PER_SECOND = 5
+MAX_CONCURRENT_SENDS = 10
+PROGRESS_EDIT_INTERVAL = 2.0
+SEND_NOW_TIMEOUT = 600
+WORKER_RESTART_DELAY = 5
 
 def load_json(filename: str) -> Dict[str, Any]:
     if not os.path.exists(filename):
@@ -42,20 +75,926 @@ async def log_event(bot: commands.Bot, title: str, action: str, user: discord.Us
         )
         await log_channel.send(embed=embed)
 
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def list_body_path(digest: str) -> str:
+    return os.path.join(LIST_BODIES_DIR, f"{digest}.z")
+
+def store_list_body(text: str) -> str:
+    
+    digest = content_hash(text)
+    path = list_body_path(digest)
+    if not os.path.exists(path):
+        os.makedirs(LIST_BODIES_DIR, exist_ok=True)
+        with open(path + ".tmp", "wb") as f:
+            f.write(zlib.compress(text.encode("utf-8"), 9))
+        os.replace(path + ".tmp", path)
+    return digest
+
+@functools.lru_cache(maxsize=256)
+def read_list_body(digest: str) -> str:
+    with open(list_body_path(digest), "rb") as f:
+        return zlib.decompress(f.read()).decode("utf-8")
+
+def list_valuation_path(digest: str) -> str:
+    return os.path.join(LIST_BODIES_DIR, f"{digest}.valuation.json")
+
+def store_list_valuation(digest: str, valuation: Dict[str, Any]) -> None:
+    path = list_valuation_path(digest)
+    os.makedirs(LIST_BODIES_DIR, exist_ok=True)
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        json.dump(valuation, f, separators=(",", ":"))
+    os.replace(path + ".tmp", path)
+
+def read_list_valuation(digest: str) -> Dict[str, Any]:
+    try:
+        with open(list_valuation_path(digest), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+def parse_export_filters(text: str) -> Dict[str, Any]:
+    
+    filters: Dict[str, Any] = {"guild": None, "since": None, "file": False}
+    units = {"m": 60, "h": 3600, "d": 86400}
+    for token in text.split():
+        key, _, value = token.lower().partition(":")
+        if key == "file" and not value:
+            filters["file"] = True
+        elif key == "guild" and value.isdigit():
+            filters["guild"] = int(value)
+        elif key == "since" and value[:-1].isdigit() and value[-1:] in units:
+            filters["since"] = time.time() - int(value[:-1]) * units[value[-1]]
+        else:
+            raise ValueError(f"Unknown filter `{token}`. Use `guild:<id>`, `since:<number><m|h|d>` or `file`.")
+    return filters
+
 def is_admin(user: discord.User) -> bool:
     return user.id == 1263756486660587543
 
+class ChannelStatus:
+    __slots__ = ("channel", "can_send", "can_create_threads", "can_manage_webhooks", "checked_at", "failures", "reason")
+
+    def __init__(self, channel: Optional[discord.abc.Messageable], reason: Optional[str] = None):
+        self.channel = channel
+        self.can_send = False
+        self.can_create_threads = False
+        self.can_manage_webhooks = False
+        self.checked_at = time.time()
+        self.failures = 0
+        self.reason = reason
+
+    @property
+    def usable(self) -> bool:
+        return self.channel is not None and self.can_send
+
+class ChannelRegistry:
+    
+    def __init__(self, bot: commands.Bot, ttl: float = CHANNEL_CHECK_TTL):
+        self.bot = bot
+        self.ttl = ttl
+        self.statuses: Dict[int, ChannelStatus] = {}
+        self.lookups: Dict[int, asyncio.Task] = {}
+
+    def check_permissions(self, channel: discord.abc.Messageable) -> ChannelStatus:
+        status = ChannelStatus(channel)
+        guild = getattr(channel, "guild", None)
+        if guild is None:
+            status.can_send = True
+            return status
+        me = guild.me
+        perms = channel.permissions_for(me) if me else None
+        if perms is None or not perms.view_channel:
+            status.reason = "missing view permission"
+            return status
+        in_thread = isinstance(channel, discord.Thread)
+        status.can_send = perms.send_messages_in_threads if in_thread else perms.send_messages
+        status.can_create_threads = perms.create_public_threads
+        status.can_manage_webhooks = perms.manage_webhooks
+        if not status.can_send:
+            status.reason = "missing send permission"
+        return status
+
+    async def lookup(self, channel_id: int) -> ChannelStatus:
+        channel = self.bot.get_channel(channel_id)
+        if channel is None:
+            try:
+                channel = await self.bot.fetch_channel(channel_id)
+            except discord.NotFound:
+                return ChannelStatus(None, "channel deleted")
+            except discord.Forbidden:
+                return ChannelStatus(None, "no access")
+            except discord.HTTPException as e:
+                status = ChannelStatus(None, f"lookup failed ({e.status})")
+                status.checked_at = 0
+                return status
+        return self.check_permissions(channel)
+
+    async def status(self, channel_id: int, refresh: bool = False) -> ChannelStatus:
+        
+        status = self.statuses.get(channel_id)
+        if status and not refresh and time.time() - status.checked_at < self.ttl:
+            return status
+        task = self.lookups.get(channel_id)
+        if task is None:
+            task = asyncio.ensure_future(self.lookup(channel_id))
+            self.lookups[channel_id] = task
+            task.add_done_callback(lambda _: self.lookups.pop(channel_id, None))
+        status = await asyncio.shield(task)
+        previous = self.statuses.get(channel_id)
+        if previous and not status.usable:
+            status.failures = previous.failures + 1
+        self.statuses[channel_id] = status
+        return status
+
+    async def resolve(self, channel_id: int) -> Optional[discord.abc.Messageable]:
+        status = await self.status(channel_id)
+        return status.channel if status.usable else None
+
+    async def resolve_many(self, channel_ids: List[int]) -> List[discord.abc.Messageable]:
+        channels = await asyncio.gather(*(self.resolve(channel_id) for channel_id in channel_ids))
+        return [channel for channel in channels if channel is not None]
+
+    def allows(self, channel_id: int, permission: str) -> bool:
+        status = self.statuses.get(channel_id)
+        return bool(status and status.usable and getattr(status, permission))
+
+    def invalidate(self, channel_id: int):
+        self.statuses.pop(channel_id, None)
+
+    def mark_failed(self, channel_id: int, error: Exception):
+        
+        if isinstance(error, (discord.Forbidden, discord.NotFound)):
+            status = self.statuses.get(channel_id)
+            if status:
+                status.checked_at = 0
+                status.failures += 1
+
+class Broadcast:
+    
+    def __init__(self, user_id: int, automated: bool = False, interval: int = 0, end_time: Optional[datetime] = None):
+        self.user_id = user_id
+        self.automated = automated
+        self.interval = interval
+        self.end_time = end_time
+        self.next_due = time.time()
+        self.content = ""
+        self.embed: Optional[discord.Embed] = None
+        self.user: Optional[discord.User] = None
+        self.channels: List[discord.abc.Messageable] = []
+        self.pending: deque = deque()
+        self.in_flight: Set[discord.abc.Messageable] = set()
+        self.view: Optional[discord.ui.View] = None
+        self.progress: Optional[Callable[["Broadcast"], Awaitable[None]]] = None
+        self.progress_at = 0.0
+        
+        self.resume_channel_ids: Optional[List[int]] = None
+        self.sent = 0
+        self.failed = 0
+        self.skipped = 0
+        self.edited = 0
+        self.last_run: Optional[float] = None
+        self.scheduled = False
+        self.paused = False
+        self.cancelled = False
+        self.done: Optional[asyncio.Future] = None
+
+class ListBroadcaster:
+    
+    def __init__(self, cog: "ListCog"):
+        self.cog = cog
+        self.heap: List[Tuple[float, int, Broadcast]] = []
+        self.ready: deque = deque()
+        self.sequence = itertools.count()
+        self.channel_next_send: Dict[int, float] = {}
+        self.global_next_send = 0.0
+        self.slots = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
+        self.deliveries: Set[asyncio.Task] = set()
+        self.wakeup = asyncio.Event()
+        self.worker: Optional[asyncio.Task] = None
+        self.stopped = False
+
+    def start(self):
+        self.stopped = False
+        self.spawn()
+
+    def spawn(self):
+        if self.stopped:
+            return
+        self.worker = asyncio.create_task(self.run())
+        self.worker.add_done_callback(self.restart)
+
+    def restart(self, task: asyncio.Task):
+        if self.stopped or task.cancelled():
+            return
+        print(f"List broadcaster stopped unexpectedly, restarting: {task.exception()}")
+        asyncio.get_running_loop().call_later(WORKER_RESTART_DELAY, self.spawn)
+
+    def stop(self):
+        self.stopped = True
+        if self.worker:
+            self.worker.cancel()
+        for task in list(self.deliveries):
+            task.cancel()
+        for broadcast in list(self.ready) + [entry[2] for entry in self.heap]:
+            if broadcast.done and not broadcast.done.done():
+                broadcast.done.cancel()
+
+    def schedule(self, broadcast: Broadcast, due: float):
+        broadcast.next_due = due
+        broadcast.scheduled = True
+        heapq.heappush(self.heap, (due, next(self.sequence), broadcast))
+        self.wakeup.set()
+
+    def cancel(self, broadcast: Broadcast):
+        
+        broadcast.cancelled = True
+        broadcast.pending.clear()
+        if broadcast in self.ready:
+            self.ready.remove(broadcast)
+
+    def pause(self, broadcast: Broadcast):
+        broadcast.paused = True
+        if broadcast in self.ready:
+            self.ready.remove(broadcast)
+
+    def resume(self, broadcast: Broadcast):
+        broadcast.paused = False
+        if broadcast.pending:
+            self.ready.append(broadcast)
+            self.wakeup.set()
+        elif not broadcast.scheduled and not broadcast.in_flight:
+            self.schedule(broadcast, max(broadcast.next_due, time.time()))
+
+    async def send_now(self, broadcast: Broadcast) -> Broadcast:
+        broadcast.done = asyncio.get_running_loop().create_future()
+        self.schedule(broadcast, time.time())
+        try:
+            await asyncio.wait_for(broadcast.done, SEND_NOW_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.cancel(broadcast)
+        return broadcast
+
+    def next_delivery(self, now: float):
+        
+        soonest = None
+        for _ in range(len(self.ready)):
+            broadcast = self.ready[0]
+            self.ready.rotate(-1)
+            for channel in broadcast.pending:
+                ready_at = self.channel_next_send.get(channel.id, 0)
+                if ready_at <= now:
+                    broadcast.pending.remove(channel)
+                    return broadcast, channel, 0
+                soonest = ready_at if soonest is None else min(soonest, ready_at)
+        return None, None, (soonest - now) if soonest is not None else None
+
+    async def idle(self, timeout: Optional[float]):
+        self.wakeup.clear()
+        try:
+            await asyncio.wait_for(self.wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def dispatch(self, broadcast: Broadcast, channel: discord.abc.Messageable):
+        try:
+            if await self.cog.deliver(broadcast, channel):
+                broadcast.sent += 1
+            else:
+                broadcast.failed += 1
+        except Exception as e:
+            print(f"Error delivering list to {channel.id}: {e}")
+            broadcast.failed += 1
+        finally:
+            broadcast.in_flight.discard(channel)
+            self.slots.release()
+        if not broadcast.pending and not broadcast.in_flight:
+            self.settle(broadcast)
+        elif broadcast.progress and time.time() - broadcast.progress_at >= PROGRESS_EDIT_INTERVAL:
+            broadcast.progress_at = time.time()
+            try:
+                await broadcast.progress(broadcast)
+            except Exception as e:
+                print(f"Error reporting list progress: {e}")
+
+    def finish(self, broadcast: Broadcast):
+        if broadcast in self.ready:
+            self.ready.remove(broadcast)
+        if broadcast.cancelled:
+            return
+        if not broadcast.automated:
+            if broadcast.done and not broadcast.done.done():
+                broadcast.done.set_result(broadcast)
+            return
+        next_due = max(broadcast.next_due + broadcast.interval, time.time())
+        if broadcast.end_time and datetime.fromtimestamp(next_due, timezone.utc) < broadcast.end_time:
+            self.schedule(broadcast, next_due)
+            self.cog.on_automation_cycle(broadcast)
+        else:
+            asyncio.create_task(self.cog.on_automation_end(broadcast))
+
+    def settle(self, broadcast: Broadcast):
+        try:
+            self.finish(broadcast)
+        except Exception as e:
+            print(f"Error finishing list broadcast for {broadcast.user_id}: {e}")
+            if broadcast.done and not broadcast.done.done():
+                broadcast.done.set_result(broadcast)
+
+    async def run(self):
+        while True:
+            now = time.time()
+            while self.heap and self.heap[0][0] <= now:
+                _, _, broadcast = heapq.heappop(self.heap)
+                broadcast.scheduled = False
+                if broadcast.cancelled or broadcast.paused:
+                    continue
+                broadcast.last_run = now
+                try:
+                    prepared = await self.cog.prepare_broadcast(broadcast)
+                except Exception as e:
+                    print(f"Error preparing list broadcast for {broadcast.user_id}: {e}")
+                    broadcast.pending.clear()
+                    prepared = False
+                if prepared:
+                    self.ready.append(broadcast)
+                else:
+                    self.settle(broadcast)
+            broadcast, channel, wait = self.next_delivery(now)
+            if broadcast is None:
+                due_in = self.heap[0][0] - now if self.heap else None
+                timeouts = [timeout for timeout in (wait, due_in) if timeout is not None]
+                await self.idle(min(timeouts) if timeouts else None)
+                continue
+
+            broadcast.in_flight.add(channel)
+            self.channel_next_send[channel.id] = now + self.cog.send_interval(channel)
+            await self.slots.acquire()
+            now = time.time()
+            if self.global_next_send > now:
+                await asyncio.sleep(self.global_next_send - now)
+            self.global_next_send = max(now, self.global_next_send) + 1 / GLOBAL_SENDS_PER_SECOND
+            task = asyncio.create_task(self.dispatch(broadcast, channel))
+            self.deliveries.add(task)
+            task.add_done_callback(self.deliveries.discard)
+
+class AdminExportView(discord.ui.View):
+    
+    PAGE_SIZE = 10
+
+    def __init__(self, author_id: int, title: str, records: Iterator[Dict[str, Any]], formatter: Callable[[Dict[str, Any]], str]):
+        super().__init__(timeout=120)
+        self.author_id = author_id
+        self.title = title
+        self.records = records
+        self.formatter = formatter
+        self.pages: List[List[str]] = []
+        self.exhausted = False
+        self.page = 0
+        self.render_page()
+
+    def load_page(self, index: int):
+        while len(self.pages) <= index and not self.exhausted:
+            page = [self.formatter(record) for record in itertools.islice(self.records, self.PAGE_SIZE)]
+            if page:
+                self.pages.append(page)
+            if len(page) < self.PAGE_SIZE:
+                self.exhausted = True
+
+    def render_page(self):
+        self.load_page(self.page + 1)
+        self.clear_items()
+        if len(self.pages) > 1:
+            previous_button = discord.ui.Button(label="Previous", style=discord.ButtonStyle.secondary, disabled=self.page == 0)
+            previous_button.callback = self.generate_page_callback(-1)
+            self.add_item(previous_button)
+            next_button = discord.ui.Button(label="Next", style=discord.ButtonStyle.secondary, disabled=self.page >= len(self.pages) - 1)
+            next_button.callback = self.generate_page_callback(1)
+            self.add_item(next_button)
+
+    def build_embed(self) -> discord.Embed:
+        lines = self.pages[self.page] if self.pages else ["No records match these filters."]
+        embed = discord.Embed(title=self.title, description="\n".join(lines)[:4000], color=discord.Color.blurple())
+        suffix = "" if self.exhausted else "+"
+        embed.set_footer(text=f"Page {self.page + 1}/{len(self.pages) or 1}{suffix}")
+        return embed
+
+    def generate_page_callback(self, step: int):
+        async def page_callback(interaction: discord.Interaction):
+            if interaction.user.id != self.author_id:
+                await interaction.response.send_message("This export is not yours.", ephemeral=True)
+                return
+            self.page = max(self.page + step, 0)
+            self.render_page()
+            self.page = min(self.page, len(self.pages) - 1)
+            await interaction.response.edit_message(embed=self.build_embed(), view=self)
+        return page_callback
+
 class ListCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
        
-        self.automations: Dict[int, asyncio.Task] = {}
+        self.automations: Dict[int, Broadcast] = {}
+        self.broadcaster = ListBroadcaster(self)
+        self.delivery_mode = load_json(SETUP_FILE).get("delivery_mode", "bot")
+        self.channels = ChannelRegistry(bot)
+        self.webhooks: Dict[int, discord.Webhook] = {}
+        self.webhook_locks: Dict[int, asyncio.Lock] = {}
+        self.recent_messages: Dict[int, deque] = {}
+        deliveries = load_json(LIST_DELIVERIES_FILE)
+        self.posted: Dict[str, Dict[str, Any]] = deliveries.get("posts", {})
+        self.post_keys: Dict[int, str] = {record["message_id"]: key for key, record in self.posted.items()}
+        self.rest_calls_saved: int = deliveries.get("rest_calls_saved", 0)
+        self.migrate_list_bodies()
+        self.special_serials = {69420, 420, 42069, 69, 6969, 696969, 420420}
+        self.low_serial_threshold = 100
+        self.load_values()
+        self.index_built = False
+        self.item_index: Dict[str, Set[str]] = {}
+        self.token_index: Dict[str, Set[str]] = {}
+        self.list_terms: Dict[str, Tuple[FrozenSet[str], FrozenSet[str]]] = {}
+        self.have_index: Dict[str, Set[str]] = {}
+        self.want_index: Dict[str, Set[str]] = {}
+        self.list_sides: Dict[str, Tuple[FrozenSet[str], FrozenSet[str]]] = {}
+
+    async def cog_load(self):
+        self.broadcaster.start()
+        self.restore_automations()
+        self.check_channel_health.start()
+
+    async def cog_unload(self):
+        for broadcast in self.automations.values():
+            if broadcast.pending or broadcast.in_flight:
+                self.save_automation_state(broadcast, [channel.id for channel in [*broadcast.in_flight, *broadcast.pending]])
+        self.broadcaster.stop()
+        self.check_channel_health.cancel()
+        self.save_deliveries()
+
+    @tasks.loop(minutes=CHANNEL_HEALTH_INTERVAL)
+    async def check_channel_health(self):
+        
+        guild_channels = load_json(GUILDCHANNELS_FILE)
+        if not isinstance(guild_channels, list):
+            return
+        changed = False
+        for entry in guild_channels:
+            channel_id = entry.get("channel_id")
+            if not channel_id:
+                continue
+            status = await self.channels.status(channel_id, refresh=True)
+            reason = None if status.usable else status.reason
+            if entry.get("unreachable") != reason:
+                if reason:
+                    entry["unreachable"] = reason
+                    print(f"List target channel {channel_id} is unreachable: {reason}")
+                else:
+                    entry.pop("unreachable", None)
+                changed = True
+        if changed:
+            save_json(GUILDCHANNELS_FILE, guild_channels)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        self.channels.invalidate(channel.id)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+        self.channels.invalidate(after.id)
+
+    def save_deliveries(self):
+        for key, record in list(self.posted.items()):
+            recent = self.recent_messages.get(int(key.split(":")[0]))
+            if recent is not None and record["message_id"] not in recent:
+                self.forget_post(record["message_id"])
+        save_json(LIST_DELIVERIES_FILE, {"posts": self.posted, "rest_calls_saved": self.rest_calls_saved})
+
+    def record_post(self, key: str, message_id: int, digest: str, webhook: bool):
+        previous = self.posted.get(key)
+        if previous:
+            self.post_keys.pop(previous["message_id"], None)
+        self.posted[key] = {"hash": digest, "message_id": message_id, "webhook": webhook}
+        self.post_keys[message_id] = key
+
+    def forget_post(self, message_id: int):
+        key = self.post_keys.pop(message_id, None)
+        if key and self.posted.get(key, {}).get("message_id") == message_id:
+            del self.posted[key]
+
+    @commands.Cog.listener()
+    async def on_message(self, message: discord.Message):
+        recent = self.recent_messages.get(message.channel.id)
+        if recent is not None:
+            if len(recent) == recent.maxlen:
+                self.forget_post(recent[0])
+            recent.append(message.id)
+
+    @commands.Cog.listener()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent):
+        recent = self.recent_messages.get(payload.channel_id)
+        if recent is not None and payload.message_id in recent:
+            recent.remove(payload.message_id)
+        self.forget_post(payload.message_id)
+
+    @commands.Cog.listener()
+    async def on_raw_bulk_message_delete(self, payload: discord.RawBulkMessageDeleteEvent):
+        recent = self.recent_messages.get(payload.channel_id)
+        for message_id in payload.message_ids:
+            if recent is not None and message_id in recent:
+                recent.remove(message_id)
+            self.forget_post(message_id)
+
+    def restore_automations(self):
+        
+        setup_data = load_json(SETUP_FILE)
+        now = datetime.now(timezone.utc)
+        expired = []
+        for user_id, user_setup in setup_data.items():
+            if not (user_id.isdigit() and isinstance(user_setup, dict) and "list_interval" in user_setup):
+                continue
+            try:
+                end_time = datetime.fromisoformat(user_setup["end_time"])
+                next_run = datetime.fromisoformat(user_setup["next_run"]) if user_setup.get("next_run") else now
+            except ValueError:
+                continue
+            if now >= end_time:
+                expired.append(user_id)
+                continue
+            
+            due = max(next_run, now).timestamp()
+            broadcast = self.start_automation(int(user_id), user_setup["list_interval"], end_time, due)
+            if user_setup.get("pending_channel_ids"):
+                broadcast.resume_channel_ids = user_setup["pending_channel_ids"]
+            if user_setup.get("paused"):
+                self.broadcaster.pause(broadcast)
+        if expired:
+            for user_id in expired:
+                del setup_data[user_id]
+            save_json(SETUP_FILE, setup_data)
+
+    def save_automation_state(self, broadcast: Broadcast, pending_channel_ids: List[int]):
+        setup_data = load_json(SETUP_FILE)
+        user_setup = setup_data.get(str(broadcast.user_id))
+        if not isinstance(user_setup, dict):
+            return
+        user_setup["next_run"] = datetime.fromtimestamp(broadcast.next_due, timezone.utc).isoformat()
+        user_setup["pending_channel_ids"] = pending_channel_ids
+        user_setup["paused"] = broadcast.paused
+        save_json(SETUP_FILE, setup_data)
+
+    def stop_automation(self, user_id: int) -> bool:
+        
+        broadcast = self.automations.pop(user_id, None)
+        if broadcast is not None:
+            self.broadcaster.cancel(broadcast)
+        setup_data = load_json(SETUP_FILE)
+        if str(user_id) in setup_data:
+            del setup_data[str(user_id)]
+            save_json(SETUP_FILE, setup_data)
+            return True
+        return broadcast is not None
+
+    def describe_automation(self, broadcast: Broadcast) -> str:
+        if broadcast.paused:
+            status = "paused"
+        elif broadcast.pending:
+            status = f"sending ({len(broadcast.pending)} channel(s) left)"
+        else:
+            status = f"next run <t:{int(broadcast.next_due)}:R>"
+        last_run = f"<t:{int(broadcast.last_run)}:R>" if broadcast.last_run else "never"
+        ends = f"<t:{int(broadcast.end_time.timestamp())}:R>" if broadcast.end_time else "never"
+        return (f"<@{broadcast.user_id}>: {status}, every {broadcast.interval // 3600}h, "
+                f"last run {last_run}, sent {broadcast.sent}, failed {broadcast.failed}, "
+                f"unchanged {broadcast.skipped}, edited {broadcast.edited}, ends {ends}")
+
+    def load_values(self):
+        if os.path.exists(VALUES_FILE):
+            with open(VALUES_FILE, "r", encoding="utf-8") as f:
+                try:
+                    self.item_data = json.load(f)
+                except json.JSONDecodeError:
+                    self.item_data = {}
+            self.values_version = os.path.getmtime(VALUES_FILE)
+        else:
+            self.item_data = {}
+            self.values_version = None
+        self.all_items = []
+        for group in ["items", "event_items", "miscellaneous_items", "kukri_items"]:
+            if group in self.item_data:
+                self.all_items.extend(list(self.item_data[group].keys()))
+        self.item_lookup = {" ".join(name.lower().split()): name for name in self.all_items}
+        self.item_values: Dict[str, int] = {}
+
+    def reload_values_if_changed(self):
+        try:
+            mtime = os.path.getmtime(VALUES_FILE)
+        except OSError:
+            return
+        if mtime != self.values_version:
+            self.load_values()
+            self.index_built = False
+
+    def phrase_lookup(self) -> Dict[str, str]:
+        phrases = dict(self.item_lookup)
+        detection = self.bot.get_cog("MessageDetection")
+        if detection is not None:
+            for alias, canonical in detection.alias_mapping.items():
+                if canonical in self.all_items:
+                    phrases.setdefault(" ".join(alias.lower().split()), canonical)
+        return phrases
+
+    def extract_terms(self, text: str, phrases: Dict[str, str]) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        
+        words = re.findall(r"[a-z0-9']+", text.lower())
+        longest = max((phrase.count(" ") + 1 for phrase in phrases), default=0)
+        items = set()
+        for start in range(len(words)):
+            for size in range(min(longest, len(words) - start), 0, -1):
+                item = phrases.get(" ".join(words[start:start + size]))
+                if item:
+                    items.add(item)
+                    break
+        tokens = frozenset(word for word in words if len(word) > 1)
+        return frozenset(items), tokens
+
+    def parse_sides(self, text: str, phrases: Dict[str, str]) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+        
+        have, want = set(), set()
+        side = have
+        position = 0
+        for match in SIDE_PATTERN.finditer(text):
+            side.update(self.extract_terms(text[position:match.start()], phrases)[0])
+            keyword = " ".join((match.group(1) or match.group(2)).lower().split())
+            side = have if keyword in HAVE_KEYWORDS else want
+            position = match.end()
+        side.update(self.extract_terms(text[position:], phrases)[0])
+        return frozenset(have), frozenset(want)
+
+    def index_list(self, user_id: str, text: str, phrases: Optional[Dict[str, str]] = None):
+        if not self.index_built:
+            return
+        self.unindex_list(user_id)
+        phrases = phrases if phrases is not None else self.phrase_lookup()
+        items, tokens = self.extract_terms(text, phrases)
+        have, want = self.parse_sides(text, phrases)
+        for index, keys in ((self.item_index, items), (self.token_index, tokens), (self.have_index, have), (self.want_index, want)):
+            for key in keys:
+                index.setdefault(key, set()).add(user_id)
+        self.list_terms[user_id] = (items, tokens)
+        self.list_sides[user_id] = (have, want)
+
+    def unindex_list(self, user_id: str):
+        items, tokens = self.list_terms.pop(user_id, (frozenset(), frozenset()))
+        have, want = self.list_sides.pop(user_id, (frozenset(), frozenset()))
+        for index, keys in ((self.item_index, items), (self.token_index, tokens), (self.have_index, have), (self.want_index, want)):
+            for key in keys:
+                postings = index.get(key)
+                if postings is not None:
+                    postings.discard(user_id)
+                    if not postings:
+                        del index[key]
+
+    def ensure_index(self):
+        self.reload_values_if_changed()
+        if self.index_built:
+            return
+        self.clear_index()
+        self.index_built = True
+        phrases = self.phrase_lookup()
+        for user_id, user_list in self.load_lists().items():
+            if isinstance(user_list, dict) and user_list.get("body"):
+                self.index_list(user_id, self.list_text(user_list), phrases)
+
+    def clear_index(self):
+        self.item_index, self.token_index, self.list_terms = {}, {}, {}
+        self.have_index, self.want_index, self.list_sides = {}, {}, {}
+
+    def item_base_value(self, item: str) -> int:
+        if item not in self.item_values:
+            try:
+                self.item_values[item] = self.get_item_value(item)[0]
+            except (ValueError, KeyError, IndexError):
+                self.item_values[item] = 0
+        return self.item_values[item]
+
+    def find_matches(self, user_id: str) -> List[Tuple[int, str, List[str], List[str]]]:
+        
+        self.ensure_index()
+        have, want = self.list_sides.get(user_id, (frozenset(), frozenset()))
+        gets: Dict[str, List[str]] = {}
+        gives: Dict[str, List[str]] = {}
+        for item in want:
+            for other in self.have_index.get(item, ()):
+                gets.setdefault(other, []).append(item)
+        for item in have:
+            for other in self.want_index.get(item, ()):
+                gives.setdefault(other, []).append(item)
+        results = []
+        for other in (gets.keys() | gives.keys()) - {user_id}:
+            receive = sorted(gets.get(other, []))
+            send = sorted(gives.get(other, []))
+            score = sum(map(self.item_base_value, receive)) + sum(map(self.item_base_value, send))
+            results.append((bool(receive and send), score, other, receive, send))
+        best = heapq.nlargest(MATCH_RESULT_LIMIT, results, key=lambda r: (r[0], r[1]))
+        return [(score, other, receive, send) for _, score, other, receive, send in best]
+
+    def list_valuation(self, text: str) -> Dict[str, Any]:
+        self.reload_values_if_changed()
+        items = self.extract_terms(text, self.phrase_lookup())[0]
+        priced = sorted(([item, self.item_base_value(item)] for item in items), key=lambda p: (-p[1], p[0]))
+        return {
+            "hash": content_hash(text),
+            "version": self.values_version,
+            "items": priced,
+            "total": sum(value for _, value in priced)
+        }
+
+    def cached_valuation(self, user_list: Dict[str, Any]) -> Dict[str, Any]:
+        
+        self.reload_values_if_changed()
+        digest = user_list.get("body")
+        valuation = read_list_valuation(digest) if digest else {}
+        if valuation.get("hash") == digest and valuation.get("version") == self.values_version:
+            return valuation
+        valuation = self.list_valuation(self.list_text(user_list))
+        if digest and valuation["hash"] == digest:
+            store_list_valuation(digest, valuation)
+        return valuation
+
+    def valuation_embed(self, valuation: Dict[str, Any]) -> Optional[discord.Embed]:
+        items = valuation.get("items") or []
+        if not items:
+            return None
+        lines = [f"- {name}: {self.format_cash(value) if value else 'N/A'}" for name, value in items[:VALUATION_ITEM_LIMIT]]
+        if len(items) > VALUATION_ITEM_LIMIT:
+            lines.append(f"...and {len(items) - VALUATION_ITEM_LIMIT} more.")
+        embed = discord.Embed(title="List valuation", description="\n".join(lines), color=discord.Color.gold())
+        embed.set_footer(text=f"Estimated total: {self.format_cash(valuation['total'])}")
+        return embed
+
+    def resolve_search_item(self, query: str) -> Optional[str]:
+        trading = self.bot.get_cog("Trading")
+        if trading is not None:
+            try:
+                return trading.match_item(query)
+            except ValueError:
+                return None
+        return self.phrase_lookup().get(" ".join(query.lower().split()))
+
+    def search_lists(self, query: str) -> Tuple[Optional[str], List[str]]:
+        
+        self.ensure_index()
+        item = self.resolve_search_item(query)
+        item_hits = self.item_index.get(item, set()) if item else set()
+        words = [word for word in re.findall(r"[a-z0-9']+", query.lower()) if len(word) > 1]
+        token_hits: Set[str] = set()
+        if words:
+            postings = sorted((self.token_index.get(word, set()) for word in words), key=len)
+            token_hits = set(postings[0]).intersection(*postings[1:])
+        return item, sorted(item_hits) + sorted(token_hits - item_hits)
+
+    def filter_user_ids(self, user_ids, filters: Dict[str, Any], user: Optional[discord.User] = None):
+        guild = self.bot.get_guild(filters["guild"]) if filters["guild"] else None
+        for user_id in user_ids:
+            if user and int(user_id) != user.id:
+                continue
+            if filters["guild"] and (guild is None or guild.get_member(int(user_id)) is None):
+                continue
+            yield user_id
+
+    def iter_list_records(self, filters: Dict[str, Any], user: Optional[discord.User] = None) -> Iterator[Dict[str, Any]]:
+        
+        lists_data = self.load_lists()
+        for user_id in self.filter_user_ids(list(lists_data), filters, user):
+            entry = lists_data[user_id]
+            if not isinstance(entry, dict):
+                continue
+            if filters["since"]:
+                try:
+                    if datetime.fromisoformat(entry.get("last_sent", "")).timestamp() < filters["since"]:
+                        continue
+                except ValueError:
+                    continue
+            yield {
+                "user_id": user_id,
+                "username": entry.get("username"),
+                "last_sent": entry.get("last_sent"),
+                "total_value": read_list_valuation(entry["body"]).get("total") if entry.get("body") else None,
+                "list": self.list_text(entry)
+            }
+
+    def iter_automation_records(self, filters: Dict[str, Any], user: Optional[discord.User] = None) -> Iterator[Dict[str, Any]]:
+        for user_id in self.filter_user_ids(list(self.automations), filters, user):
+            broadcast = self.automations.get(user_id)
+            if broadcast is None or (filters["since"] and (broadcast.last_run or 0) < filters["since"]):
+                continue
+            yield {
+                "user_id": user_id,
+                "paused": broadcast.paused,
+                "interval": broadcast.interval,
+                "next_run": datetime.fromtimestamp(broadcast.next_due, timezone.utc).isoformat(),
+                "last_run": datetime.fromtimestamp(broadcast.last_run, timezone.utc).isoformat() if broadcast.last_run else None,
+                "end_time": broadcast.end_time.isoformat() if broadcast.end_time else None,
+                "sent": broadcast.sent,
+                "failed": broadcast.failed,
+                "unchanged": broadcast.skipped,
+                "edited": broadcast.edited,
+                "summary": self.describe_automation(broadcast)
+            }
+
+    def format_list_record(self, record: Dict[str, Any]) -> str:
+        preview = " ".join(record["list"].split())
+        if len(preview) > 80:
+            preview = preview[:77] + "..."
+        last_sent = record["last_sent"] or "never"
+        try:
+            last_sent = f"<t:{int(datetime.fromisoformat(last_sent).timestamp())}:R>"
+        except ValueError:
+            pass
+        return f"- <@{record['user_id']}> ({record['username']}), last sent {last_sent}: {preview}"
+
+    async def send_admin_export(self, ctx, title: str, filename: str, records: Iterator[Dict[str, Any]], formatter: Callable[[Dict[str, Any]], str], as_file: bool, total: int):
+        
+        if not as_file and total <= EXPORT_FILE_THRESHOLD:
+            view = AdminExportView(ctx.author.id, title, records, formatter)
+            await ctx.send(embed=view.build_embed(), view=view)
+            return
+        count = 0
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", suffix=".jsonl", delete=False) as f:
+            path = f.name
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+                count += 1
+        try:
+            await ctx.send(f"{title}: {count} record(s).", file=discord.File(path, filename=filename))
+        finally:
+            os.remove(path)
 
     def load_lists(self) -> Dict[str, Any]:
         return load_json(LISTS_FILE)
     
     def save_lists(self, data: Dict[str, Any]) -> None:
-        save_json(LISTS_FILE, data)
+        
+        with open(LISTS_FILE, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+    def migrate_list_bodies(self):
+        lists_data = self.load_lists()
+        migrated = False
+        for user_list in lists_data.values():
+            if not isinstance(user_list, dict):
+                continue
+            if "list" in user_list:
+                user_list["body"] = store_list_body(user_list.pop("list"))
+                migrated = True
+            if "valuation" in user_list:
+                valuation = user_list.pop("valuation")
+                if isinstance(valuation, dict) and valuation.get("hash") == user_list.get("body"):
+                    store_list_valuation(user_list["body"], valuation)
+                migrated = True
+        if migrated:
+            self.save_lists(lists_data)
+
+    def list_text(self, user_list: Dict[str, Any]) -> str:
+        try:
+            return read_list_body(user_list["body"])
+        except (KeyError, OSError, zlib.error) as e:
+            print(f"Error reading list body: {e}")
+            return ""
+
+    def release_list_body(self, digest: Optional[str], lists_data: Dict[str, Any]):
+        if not digest or any(entry.get("body") == digest for entry in lists_data.values() if isinstance(entry, dict)):
+            return
+        for path in (list_body_path(digest), list_valuation_path(digest)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def drop_list(self, lists_data: Dict[str, Any], user_id: str) -> bool:
+        user_list = lists_data.pop(user_id, None)
+        if user_list is None:
+            return False
+        self.save_lists(lists_data)
+        self.unindex_list(user_id)
+        self.release_list_body(user_list.get("body"), lists_data)
+        return True
+
+    def store_list(self, user: discord.User, text: str) -> Dict[str, Any]:
+        lists_data = self.load_lists()
+        previous = lists_data.get(str(user.id), {})
+        digest = store_list_body(text)
+        valuation = self.list_valuation(text)
+        store_list_valuation(digest, valuation)
+        lists_data[str(user.id)] = {
+            "username": user.name,
+            "body": digest,
+            "last_sent": datetime.now(timezone.utc).isoformat()
+        }
+        self.save_lists(lists_data)
+        self.release_list_body(previous.get("body"), lists_data)
+        self.index_list(str(user.id), text)
+        return valuation
     
     def load_setup(self) -> Dict[str, Any]:
         return load_json(SETUP_FILE)
@@ -183,6 +1122,142 @@ class ListCog(commands.Cog):
         view.add_item(button_how)
         return view
 
+    async def resolve_target_channels(self) -> List[discord.abc.Messageable]:
+        guild_channels = load_json(GUILDCHANNELS_FILE)
+        if not isinstance(guild_channels, list):
+            return []
+        channel_ids = [entry.get("channel_id") for entry in guild_channels if entry.get("channel_id") and not entry.get("unreachable")]
+        return await self.channels.resolve_many(channel_ids)
+
+    async def prepare_broadcast(self, broadcast: Broadcast) -> bool:
+        
+        if broadcast.automated:
+            user_list = self.load_lists().get(str(broadcast.user_id))
+            if not user_list:
+                return False
+            broadcast.content = self.list_text(user_list)
+            broadcast.embed = self.valuation_embed(self.cached_valuation(user_list))
+            if broadcast.resume_channel_ids is not None:
+                broadcast.channels = await self.channels.resolve_many(broadcast.resume_channel_ids)
+                broadcast.resume_channel_ids = None
+            else:
+                broadcast.channels = await self.resolve_target_channels()
+            broadcast.user = self.bot.get_user(broadcast.user_id)
+            self.save_automation_state(broadcast, [channel.id for channel in broadcast.channels])
+        broadcast.pending = deque(broadcast.channels)
+        return bool(broadcast.pending)
+
+    def uses_webhook(self, channel: discord.abc.Messageable) -> bool:
+        return (self.delivery_mode == "webhook" and isinstance(channel, discord.TextChannel)
+                and self.channels.allows(channel.id, "can_manage_webhooks"))
+
+    def send_interval(self, channel: discord.abc.Messageable) -> float:
+        return WEBHOOK_SEND_INTERVAL if self.uses_webhook(channel) else CHANNEL_SEND_INTERVAL
+
+    async def get_webhook(self, channel: discord.TextChannel) -> discord.Webhook:
+        webhook = self.webhooks.get(channel.id)
+        if webhook:
+            return webhook
+        lock = self.webhook_locks.setdefault(channel.id, asyncio.Lock())
+        async with lock:
+            webhook = self.webhooks.get(channel.id)
+            if webhook:
+                return webhook
+            for existing in await channel.webhooks():
+                if existing.name == LIST_WEBHOOK_NAME and existing.user and existing.user.id == self.bot.user.id:
+                    webhook = existing
+                    break
+            else:
+                webhook = await channel.create_webhook(name=LIST_WEBHOOK_NAME)
+            self.webhooks[channel.id] = webhook
+            return webhook
+
+    async def update_previous_post(self, broadcast: Broadcast, channel: discord.abc.Messageable, record: Dict[str, Any], digest: str) -> bool:
+        
+        if record["message_id"] not in self.recent_messages.get(channel.id, ()):
+            return False
+        if record["hash"] == digest:
+            broadcast.skipped += 1
+            self.rest_calls_saved += 1
+            return True
+        try:
+            if record.get("webhook") and channel.id in self.webhooks:
+                await self.webhooks[channel.id].edit_message(record["message_id"], content=broadcast.content, embed=broadcast.embed)
+            elif not record.get("webhook"):
+                await channel.get_partial_message(record["message_id"]).edit(content=broadcast.content, embed=broadcast.embed)
+            else:
+                return False
+        except Exception as e:
+            print(f"Error editing list in channel {channel.id}: {e}")
+            return False
+        record["hash"] = digest
+        broadcast.edited += 1
+        return True
+
+    async def deliver(self, broadcast: Broadcast, channel: discord.abc.Messageable) -> bool:
+        key = f"{channel.id}:{broadcast.user_id}"
+        digest = content_hash(broadcast.content + (broadcast.embed.description if broadcast.embed else ""))
+        record = self.posted.get(key)
+        if record and await self.update_previous_post(broadcast, channel, record, digest):
+            return True
+        self.recent_messages.setdefault(channel.id, deque(maxlen=RECENT_MESSAGE_WINDOW))
+        if broadcast.user and self.uses_webhook(channel):
+            try:
+                webhook = await self.get_webhook(channel)
+                extra = {"embed": broadcast.embed} if broadcast.embed else {}
+                message = await webhook.send(
+                    broadcast.content,
+                    username=broadcast.user.display_name,
+                    avatar_url=broadcast.user.display_avatar.url,
+                    wait=True,
+                    **extra
+                )
+                self.record_post(key, message.id, digest, True)
+                return True
+            except Exception as e:
+                if isinstance(e, (discord.NotFound, discord.Forbidden)):
+                    self.webhooks.pop(channel.id, None)
+                print(f"Webhook delivery failed for channel {channel.id}, falling back to bot send: {e}")
+        if broadcast.view is None and broadcast.user:
+            broadcast.view = self.create_list_view(broadcast.user)
+        try:
+            message = await channel.send(broadcast.content, embed=broadcast.embed, view=broadcast.view)
+            self.record_post(key, message.id, digest, False)
+            return True
+        except Exception as e:
+            self.channels.mark_failed(channel.id, e)
+            print(f"Error sending list to channel {channel.id}: {e}")
+            return False
+
+    def on_automation_cycle(self, broadcast: Broadcast):
+        lists_data = self.load_lists()
+        if str(broadcast.user_id) in lists_data:
+            lists_data[str(broadcast.user_id)]["last_sent"] = datetime.now(timezone.utc).isoformat()
+            self.save_lists(lists_data)
+        self.save_automation_state(broadcast, [])
+        self.save_deliveries()
+
+    async def save_automation_progress(self, broadcast: Broadcast):
+        self.save_automation_state(broadcast, [channel.id for channel in [*broadcast.in_flight, *broadcast.pending]])
+
+    async def on_automation_end(self, broadcast: Broadcast):
+        if self.automations.get(broadcast.user_id) is broadcast:
+            del self.automations[broadcast.user_id]
+        setup_data = load_json(SETUP_FILE)
+        if str(broadcast.user_id) in setup_data:
+            del setup_data[str(broadcast.user_id)]
+            save_json(SETUP_FILE, setup_data)
+        user_obj = self.bot.get_user(broadcast.user_id)
+        if user_obj:
+            await log_event(self.bot, "List Automate End", "User automation ended.", user_obj)
+
+    def start_automation(self, user_id: int, interval: int, end_time: datetime, due: float) -> Broadcast:
+        broadcast = Broadcast(user_id, automated=True, interval=interval, end_time=end_time)
+        broadcast.progress = self.save_automation_progress
+        self.automations[user_id] = broadcast
+        self.broadcaster.schedule(broadcast, due)
+        return broadcast
+
     list_group = app_commands.Group(name="list", description="User list commands.")
 
     @staticmethod
@@ -243,14 +1318,8 @@ class ListCog(commands.Cog):
             except Exception:
                 pass
             return
-        lists_data = self.load_lists()
-        lists_data[str(interaction.user.id)] = {
-            "username": interaction.user.name,
-            "list": msg.content,
-            "last_sent": datetime.now(timezone.utc).isoformat()
-        }
-        save_json(LISTS_FILE, lists_data)
-        await thread.send("Your list has been saved. This thread will be archived now.")
+        valuation = self.store_list(interaction.user, msg.content)
+        await thread.send("Your list has been saved. This thread will be archived now.", embed=self.valuation_embed(valuation))
         await thread.edit(archived=True)
         await log_event(self.bot, "List Add", "User added a trading list.", interaction.user)
 
@@ -260,10 +1329,7 @@ class ListCog(commands.Cog):
         if str(interaction.user.id) in blacklist:
             await interaction.response.send_message("You are not allowed to use list commands.", ephemeral=True)
             return
-        lists_data = self.load_lists()
-        if str(interaction.user.id) in lists_data:
-            del lists_data[str(interaction.user.id)]
-            save_json(LISTS_FILE, lists_data)
+        if self.drop_list(self.load_lists(), str(interaction.user.id)):
             await interaction.response.send_message("Your list has been deleted.", ephemeral=True)
             await log_event(self.bot, "List Delete", "User deleted their list.", interaction.user)
         else:
@@ -275,10 +1341,7 @@ class ListCog(commands.Cog):
         if str(interaction.user.id) in blacklist:
             await interaction.response.send_message("You are not allowed to use list commands.", ephemeral=True)
             return
-        lists_data = self.load_lists()
-        if str(interaction.user.id) in lists_data:
-            del lists_data[str(interaction.user.id)]
-            save_json(LISTS_FILE, lists_data)
+        self.drop_list(self.load_lists(), str(interaction.user.id))
         try:
             thread = await interaction.channel.create_thread(
                 name="Trading list",
@@ -315,14 +1378,8 @@ class ListCog(commands.Cog):
             except Exception:
                 pass
             return
-        lists_data = self.load_lists()
-        lists_data[str(interaction.user.id)] = {
-            "username": interaction.user.name,
-            "list": msg.content,
-            "last_sent": datetime.now(timezone.utc).isoformat()
-        }
-        save_json(LISTS_FILE, lists_data)
-        await thread.send("Your list has been updated. This thread will be archived now.")
+        valuation = self.store_list(interaction.user, msg.content)
+        await thread.send("Your list has been updated. This thread will be archived now.", embed=self.valuation_embed(valuation))
         await thread.edit(archived=True)
         await log_event(self.bot, "List Edit", "User edited their list.", interaction.user)
 
@@ -356,31 +1413,45 @@ class ListCog(commands.Cog):
             if channel.id not in allowed_channel_ids:
                 await interaction.followup.send("The selected channel is not configured as target channel.", ephemeral=True)
                 return
+            if not await self.channels.resolve(channel.id):
+                await interaction.followup.send("I cannot send messages in that channel.", ephemeral=True)
+                return
             target_channels.append(channel)
         else:
-            guild_channels = load_json(GUILDCHANNELS_FILE)
-            if isinstance(guild_channels, list):
-                for entry in guild_channels:
-                    ch = self.bot.get_channel(entry.get("channel_id"))
-                    if ch:
-                        target_channels.append(ch)
+            target_channels = await self.resolve_target_channels()
         if not target_channels:
             await interaction.followup.send("No target channels configured.", ephemeral=True)
             return
        
-        for ch in target_channels:
-            try:
-                user_obj = self.bot.get_user(interaction.user.id)
-                view = self.create_list_view(user_obj) if user_obj else None
-                await ch.send(user_list["list"], view=view)
-            except Exception as e:
-                print(f"Error sending list to channel {ch.id}: {e}")
-            await asyncio.sleep(15)
+        broadcast = Broadcast(interaction.user.id)
+        broadcast.content = self.list_text(user_list)
+        broadcast.embed = self.valuation_embed(self.cached_valuation(user_list))
+        broadcast.channels = target_channels
+        broadcast.user = interaction.user
+        progress_message = await interaction.followup.send(f"Sending your list to {len(target_channels)} channel(s)...", ephemeral=True, wait=True)
+
+        async def report_progress(current: Broadcast):
+            await progress_message.edit(content=f"Sending your list... {current.sent + current.failed}/{len(current.channels)} channel(s) done.")
+        broadcast.progress = report_progress
+        await self.broadcaster.send_now(broadcast)
+        self.save_deliveries()
+        lists_data = self.load_lists()
+        user_list = lists_data.get(str(interaction.user.id), user_list)
         user_list["last_sent"] = datetime.now(timezone.utc).isoformat()
         lists_data[str(interaction.user.id)] = user_list
-        save_json(LISTS_FILE, lists_data)
+        self.save_lists(lists_data)
         
-        await interaction.followup.send("Your list has been sent.", view=self.create_list_view(interaction.user), ephemeral=True)
+        summary = f"Your list has been sent to {broadcast.sent}/{len(target_channels)} channel(s)."
+        if broadcast.skipped or broadcast.edited:
+            summary += f" {broadcast.skipped} unchanged post(s) kept, {broadcast.edited} updated in place."
+        if broadcast.failed:
+            summary += f" {broadcast.failed} channel(s) failed."
+        if broadcast.cancelled:
+            summary += " Sending timed out before every channel was reached."
+        try:
+            await progress_message.edit(content=summary, view=broadcast.view)
+        except Exception:
+            await interaction.followup.send(summary, view=broadcast.view, ephemeral=True)
         await log_event(self.bot, "List Send", "User sent their list.", interaction.user)
 
     @list_group.command(name="automate", description="Automate sending your list.")
@@ -423,112 +1494,167 @@ class ListCog(commands.Cog):
         save_json(SETUP_FILE, setup_data)
         await interaction.response.send_message("Your list automation has been set up.", ephemeral=True)
         await log_event(self.bot, "List Automate", f"User set up automation with interval {interval_sec} sec and duration {duration_sec} sec.", interaction.user)
-        self.bot.loop.create_task(self.run_automation(interaction.user.id, interval_sec, duration_sec))
-
-    async def run_automation(self, user_id: int, interval: int, duration: int):
-        start_time = datetime.now(timezone.utc)
-        end_time = start_time + timedelta(seconds=duration)
-        lists_data = load_json(LISTS_FILE)
-        if str(user_id) not in lists_data:
-            return
-        user_list = lists_data[str(user_id)]["list"]
-        guild_channels = load_json(GUILDCHANNELS_FILE)
-        target_channels = []
-        if isinstance(guild_channels, list):
-            for entry in guild_channels:
-                ch = self.bot.get_channel(entry.get("channel_id"))
-                if ch:
-                    target_channels.append(ch)
-        user_obj = self.bot.get_user(user_id)
-        while datetime.now(timezone.utc) < end_time:
-            for ch in target_channels:
-                try:
-                    view = self.create_list_view(user_obj) if user_obj else None
-                    await ch.send(user_list, view=view)
-                except Exception as e:
-                    print(f"Error sending automation list to channel {ch.id}: {e}")
-                await asyncio.sleep(15)
-            lists_data[str(user_id)]["last_sent"] = datetime.now(timezone.utc).isoformat()
-            save_json(LISTS_FILE, lists_data)
-            await asyncio.sleep(interval)
-        setup_data = load_json(SETUP_FILE)
-        if str(user_id) in setup_data:
-            del setup_data[str(user_id)]
-            save_json(SETUP_FILE, setup_data)
-        if user_obj:
-            await log_event(self.bot, "List Automate End", "User automation ended.", user_obj)
+        self.start_automation(interaction.user.id, interval_sec, now + timedelta(seconds=duration_sec), time.time())
 
     @list_group.command(name="see", description="See a user's saved list.")
     async def list_see(self, interaction: discord.Interaction, user: discord.User):
-        lists_data = load_json(LISTS_FILE)
-        user_list = lists_data.get(str(user.id))
+        user_list = self.load_lists().get(str(user.id))
         if not user_list:
             await interaction.response.send_message("No list found for that user.", ephemeral=True)
             return
-        await interaction.response.send_message(user_list["list"], ephemeral=True)
+        await interaction.response.send_message(self.list_text(user_list), ephemeral=True)
         await log_event(self.bot, "List View", f"User viewed list of {user.name}", interaction.user)
 
+    @list_group.command(name="search", description="Find saved lists that mention an item.")
+    @app_commands.describe(item="Item name, alias or any word to look for")
+    @app_commands.autocomplete(item=autocomplete_items)
+    async def list_search(self, interaction: discord.Interaction, item: str):
+        item_name, user_ids = self.search_lists(item)
+        if not user_ids:
+            await interaction.response.send_message(f"No saved lists mention `{item}`.", ephemeral=True)
+            return
+        lists_data = self.load_lists()
+        lines = []
+        for user_id in user_ids[:SEARCH_RESULT_LIMIT]:
+            username = lists_data.get(user_id, {}).get("username", "Unknown")
+            lines.append(f"- <@{user_id}> ({username})")
+        if len(user_ids) > SEARCH_RESULT_LIMIT:
+            lines.append(f"...and {len(user_ids) - SEARCH_RESULT_LIMIT} more.")
+        embed = discord.Embed(
+            title=f"Lists mentioning {item_name or item}",
+            description="\n".join(lines),
+            color=discord.Color.blue()
+        )
+        embed.set_footer(text="Use /list see to view a list.")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await log_event(self.bot, "List Search", f"User searched lists for {item_name or item}", interaction.user)
+
+    @list_group.command(name="matches", description="Find lists that complement yours.")
+    async def list_matches(self, interaction: discord.Interaction):
+        lists_data = self.load_lists()
+        if str(interaction.user.id) not in lists_data:
+            await interaction.response.send_message("You have no saved list. Use /list add to create one.", ephemeral=True)
+            return
+        self.ensure_index()
+        have, want = self.list_sides.get(str(interaction.user.id), (frozenset(), frozenset()))
+        if not have and not want:
+            await interaction.response.send_message("No catalog items were recognised in your list. Use lines such as `Have: ...` and `Want: ...`.", ephemeral=True)
+            return
+        matches = self.find_matches(str(interaction.user.id))
+        if not matches:
+            await interaction.response.send_message("No complementary lists found right now.", ephemeral=True)
+            return
+        embed = discord.Embed(title="List matches <a:trade:1337122473879277580>", color=discord.Color.blue())
+        for score, other, receive, send in matches:
+            username = lists_data.get(other, {}).get("username", "Unknown")
+            lines = []
+            if receive:
+                lines.append(f"They have: {', '.join(receive)}")
+            if send:
+                lines.append(f"They want: {', '.join(send)}")
+            lines.append(f"Overlapping value: {self.format_cash(score)}")
+            embed.add_field(name=username, value=f"<@{other}>\n" + "\n".join(lines), inline=False)
+        embed.set_footer(text="Use /list see to view a list.")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await log_event(self.bot, "List Matches", f"User looked up list matches ({len(matches)} found).", interaction.user)
+
     @commands.command(name="admin_list_view")
-    async def admin_list_view(self, ctx, user: Optional[discord.User] = None):
+    async def admin_list_view(self, ctx, user: Optional[discord.User] = None, *, filters: str = ""):
         if ctx.author.id != 1263756486660587543:
             return
-        lists_data = load_json(LISTS_FILE)
-        if user:
+        try:
+            options = parse_export_filters(filters)
+        except ValueError as e:
+            await ctx.send(str(e))
+            return
+        lists_data = self.load_lists()
+        if user and not any(options.values()):
             data = lists_data.get(str(user.id))
             if not data:
                 await ctx.send("No list found for that user.")
                 return
-            await ctx.send(f"List for {user.mention}: {data['list']}")
+            await ctx.send(f"List for {user.mention}: {self.list_text(data)}"[:2000])
         else:
-            await ctx.send(f"All lists: {json.dumps(lists_data, indent=2)}")
+            await self.send_admin_export(ctx, "Saved lists", "lists.jsonl", self.iter_list_records(options, user), self.format_list_record, options["file"], len(lists_data))
         await log_event(self.bot, "Admin List View", f"Admin viewed list for {user.name if user else 'all users'}", ctx.author)
 
     @commands.command(name="admin_list_delete")
     async def admin_list_delete(self, ctx, user: Optional[discord.User] = None):
         if ctx.author.id != 1263756486660587543:
             return
-        lists_data = load_json(LISTS_FILE)
+        lists_data = self.load_lists()
         if user:
-            if str(user.id) in lists_data:
-                del lists_data[str(user.id)]
-                save_json(LISTS_FILE, lists_data)
+            if self.drop_list(lists_data, str(user.id)):
                 await ctx.send(f"List for {user.mention} deleted.")
             else:
                 await ctx.send("No list found for that user.")
         else:
-            lists_data = {}
-            save_json(LISTS_FILE, lists_data)
+            self.save_lists({})
+            for entry in lists_data.values():
+                if isinstance(entry, dict):
+                    self.release_list_body(entry.get("body"), {})
+            self.clear_index()
             await ctx.send("All lists deleted.")
         await log_event(self.bot, "Admin List Delete", f"Admin deleted list for {user.name if user else 'all users'}", ctx.author)
 
     @commands.command(name="admin_automate_view")
-    async def admin_automate_view(self, ctx, user: Optional[discord.User] = None):
+    async def admin_automate_view(self, ctx, user: Optional[discord.User] = None, *, filters: str = ""):
         if ctx.author.id != 1263756486660587543:
             return
-        setup_data = load_json(SETUP_FILE)
-        if user:
-            data = setup_data.get(str(user.id))
-            if not data:
+        try:
+            options = parse_export_filters(filters)
+        except ValueError as e:
+            await ctx.send(str(e))
+            return
+        if user and not any(options.values()):
+            broadcast = self.automations.get(user.id)
+            if not broadcast:
                 await ctx.send("No automation found for that user.")
                 return
-            await ctx.send(f"Automation for {user.mention}: {json.dumps(data, indent=2)}")
+            await ctx.send(f"Automation for {self.describe_automation(broadcast)}")
+        elif not self.automations:
+            await ctx.send("No automations are running.")
         else:
-            await ctx.send(f"All automations: {json.dumps(setup_data, indent=2)}")
+            title = f"Running automations ({len(self.automations)}), {self.rest_calls_saved} send(s) saved by deduplication"
+            await self.send_admin_export(ctx, title, "automations.jsonl", self.iter_automation_records(options, user), lambda record: record["summary"], options["file"], len(self.automations))
         await log_event(self.bot, "Admin Automate View", f"Admin viewed automation for {user.name if user else 'all users'}", ctx.author)
 
     @commands.command(name="admin_automate_stop")
     async def admin_automate_stop(self, ctx, user: discord.User):
         if ctx.author.id != 1263756486660587543:
             return
-        setup_data = load_json(SETUP_FILE)
-        if str(user.id) in setup_data:
-            del setup_data[str(user.id)]
-            save_json(SETUP_FILE, setup_data)
+        if self.stop_automation(user.id):
             await ctx.send(f"Automation for {user.mention} has been stopped.")
         else:
             await ctx.send("No active automation found for that user.")
         await log_event(self.bot, "Admin Automate Stop", f"Admin stopped automation for {user.name}", ctx.author)
 
+    @commands.command(name="admin_automate_pause")
+    async def admin_automate_pause(self, ctx, user: discord.User):
+        if ctx.author.id != 1263756486660587543:
+            return
+        broadcast = self.automations.get(user.id)
+        if not broadcast or broadcast.paused:
+            await ctx.send("No running automation found for that user.")
+            return
+        self.broadcaster.pause(broadcast)
+        self.save_automation_state(broadcast, [channel.id for channel in broadcast.pending])
+        await ctx.send(f"Automation for {user.mention} has been paused.")
+        await log_event(self.bot, "Admin Automate Pause", f"Admin paused automation for {user.name}", ctx.author)
+
+    @commands.command(name="admin_automate_resume")
+    async def admin_automate_resume(self, ctx, user: discord.User):
+        if ctx.author.id != 1263756486660587543:
+            return
+        broadcast = self.automations.get(user.id)
+        if not broadcast or not broadcast.paused:
+            await ctx.send("No paused automation found for that user.")
+            return
+        self.broadcaster.resume(broadcast)
+        self.save_automation_state(broadcast, [channel.id for channel in broadcast.pending])
+        await ctx.send(f"Automation for {self.describe_automation(broadcast)}")
+        await log_event(self.bot, "Admin Automate Resume", f"Admin resumed automation for {user.name}", ctx.author)
+
     @commands.command(name="admin_channel_add")
     async def admin_channel_add(self, ctx, channel: discord.TextChannel):
         if ctx.author.id != 1263756486660587543:
@@ -536,10 +1662,17 @@ class ListCog(commands.Cog):
         guild_channels = load_json(GUILDCHANNELS_FILE)
         if not isinstance(guild_channels, list):
             guild_channels = []
+        status = await self.channels.status(channel.id, refresh=True)
         for entry in guild_channels:
             if entry.get("channel_id") == channel.id:
+                if entry.pop("unreachable", None) and status.usable:
+                    save_json(GUILDCHANNELS_FILE, guild_channels)
+                    await ctx.send(f"Channel {channel.mention} is reachable again and has been re-enabled.")
+                    return
                 await ctx.send("Channel already exists.")
                 return
+        if not status.usable:
+            await ctx.send(f"Warning: {channel.mention} cannot receive lists right now ({status.reason}).")
         new_entry = {
             "guild_id": channel.guild.id,
             "guild_name": channel.guild.name,
@@ -582,6 +1715,23 @@ class ListCog(commands.Cog):
         await ctx.send(f"Special Member role set to {role.mention}.")
         await log_event(self.bot, "Admin Role Set", f"Admin set special member role to {role.mention}.", ctx.author)
 
+    @commands.command(name="admin_delivery_mode")
+    async def admin_delivery_mode(self, ctx, mode: str):
+        if ctx.author.id != 1263756486660587543:
+            return
+        mode = mode.lower()
+        if mode not in ("bot", "webhook"):
+            await ctx.send("Delivery mode must be either `bot` or `webhook`.")
+            return
+        setup_data = load_json(SETUP_FILE)
+        setup_data["delivery_mode"] = mode
+        save_json(SETUP_FILE, setup_data)
+        self.delivery_mode = mode
+        if mode == "bot":
+            self.webhooks.clear()
+        await ctx.send(f"List delivery mode set to `{mode}`.")
+        await log_event(self.bot, "Admin Delivery Mode", f"Admin set list delivery mode to {mode}.", ctx.author)
+
     @commands.command(name="admin_blacklist_user")
     async def admin_blacklist_user(self, ctx, user: discord.User):
         if ctx.author.id != 1263756486660587543:
@@ -40,6 +40,14 @@ class Stats(commands.Cog):
         embed.add_field(name="Investment uses", value=str(investement_uses), inline=False)
         embed.add_field(name="Tutorial uses", value=str(tutorial_uses), inline=False)
         embed.add_field(name="Your uses", value=str(your_uses), inline=False)
+        trading = self.bot.get_cog("Trading")
+        if trading is not None:
+            metrics = trading.session_metrics()
+            embed.add_field(
+                name="Open trades",
+                value=f"{metrics['sessions']} ({metrics['memory'] / 1024:.1f} KB)",
+                inline=False
+            )
         embed.add_field(
             name="**Servers:**", 
             value=f"Installed server count: {server_count}\nMain Server: Gold Rush Trading\nhttps://discord.gg/45J959xRzJ", 
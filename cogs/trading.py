@@ -1,28 +1,463 @@
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 from discord import app_commands
+import bisect
+import heapq
 import json
 import re
 import os
-from typing import Optional
+import sys
+import time
+from collections import OrderedDict
+from typing import Optional, List, Tuple
+
+TRADES_FILE = "/home/container/trades.json"
+VALUES_FILE = "/home/container/cogs/values.json"
+TRADE_HISTORY_FILE = "/home/container/tradehistory.jsonl"
+TRADE_STATS_FILE = "/home/container/tradestats.json"
+TRADE_TTL = 3600
+MAX_TRADE_SESSIONS = 5000
+BALANCE_TIME_BUDGET = 0.5
+BALANCE_MAX_ITEMS = 3
+BALANCE_SUGGESTIONS = 5
+MAX_ITEM_QUANTITY = 10
+
+class TradeEntry:
+    __slots__ = ("name", "serial", "auto_serial", "value", "version", "line")
+
+    def __init__(self, name: str, serial: Optional[int], auto_serial: bool, value: int, version: Optional[float], line: str):
+        self.name = name
+        self.serial = serial
+        self.auto_serial = auto_serial
+        self.value = value
+        
+        self.version = version
+        self.line = line
+
+    def to_list(self) -> list:
+        return [self.name, self.serial, self.auto_serial, self.value, self.version, self.line]
+
+class TradeSession:
+    __slots__ = ("offer_items", "offer_cash", "offer_total", "counter_items", "counter_cash", "counter_total", "versions", "expires_at")
+
+    def __init__(self):
+        self.offer_items = []
+        self.offer_cash = 0
+        self.offer_total = 0
+        self.counter_items = []
+        self.counter_cash = 0
+        self.counter_total = 0
+        self.versions = set()
+        self.expires_at = time.time() + TRADE_TTL
+
+    def add_entry(self, side: str, entry: TradeEntry):
+        getattr(self, f"{side}_items").append(entry)
+        setattr(self, f"{side}_total", getattr(self, f"{side}_total") + entry.value)
+        self.versions.add(entry.version)
+
+    def remove_entry(self, side: str, index: int) -> TradeEntry:
+        entry = getattr(self, f"{side}_items").pop(index)
+        setattr(self, f"{side}_total", getattr(self, f"{side}_total") - entry.value)
+        self.versions = {item.version for item in self.offer_items + self.counter_items}
+        return entry
+
+    def touch(self):
+        self.expires_at = time.time() + TRADE_TTL
+
+    def expired(self, now: float) -> bool:
+        return now >= self.expires_at
+
+    def to_dict(self) -> dict:
+        return {
+            "offer_items": [entry.to_list() for entry in self.offer_items],
+            "offer_cash": self.offer_cash,
+            "counter_items": [entry.to_list() for entry in self.counter_items],
+            "counter_cash": self.counter_cash,
+            "expires_at": self.expires_at
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TradeSession":
+        session = cls()
+        for entry in data["offer_items"]:
+            session.add_entry("offer", TradeEntry(*entry))
+        session.offer_cash = data["offer_cash"]
+        for entry in data["counter_items"]:
+            session.add_entry("counter", TradeEntry(*entry))
+        session.counter_cash = data["counter_cash"]
+        session.expires_at = data["expires_at"]
+        return session
+
+    def memory_size(self) -> int:
+        size = sys.getsizeof(self) + sys.getsizeof(self.offer_items) + sys.getsizeof(self.counter_items)
+        for entry in self.offer_items + self.counter_items:
+            size += sys.getsizeof(entry) + sys.getsizeof(entry.name)
+        return size
+
+class TradeItemModal(discord.ui.Modal):
+    def __init__(self, builder: "TradeBuilderView", side: str):
+        super().__init__(title="Add an item to your offer" if side == "offer" else "Add an item to the counter offer")
+        self.builder = builder
+        self.side = side
+        self.item = discord.ui.TextInput(label="Item", placeholder="e.g. Lancaster Pistol", max_length=100)
+        self.serial = discord.ui.TextInput(label="Serial (optional)", required=False, max_length=10)
+        self.add_item(self.item)
+        self.add_item(self.serial)
+
+    async def on_submit(self, interaction: discord.Interaction):
+        cog = self.builder.cog
+        serial_text = self.serial.value.strip()
+        try:
+            serial = int(serial_text) if serial_text else None
+        except ValueError:
+            await interaction.response.send_message("The serial must be a number.", ephemeral=True)
+            return
+        try:
+            item = cog.match_item(self.item.value)
+        except ValueError as e:
+            await interaction.response.send_message(str(e), ephemeral=True)
+            return
+        await self.builder.apply(interaction, lambda session: session.add_entry(self.side, cog.build_entry(item, serial)))
+
+class TradeCashModal(discord.ui.Modal):
+    def __init__(self, builder: "TradeBuilderView", side: str):
+        super().__init__(title="Add cash to your offer" if side == "offer" else "Add cash to the counter offer")
+        self.builder = builder
+        self.side = side
+        self.amount = discord.ui.TextInput(label="Amount", placeholder="e.g. 200k or 2M", max_length=20)
+        self.add_item(self.amount)
+
+    async def on_submit(self, interaction: discord.Interaction):
+        def add_cash(session: TradeSession):
+            cash_value = self.builder.cog.parse_cash(self.amount.value)
+            setattr(session, f"{self.side}_cash", getattr(session, f"{self.side}_cash") + cash_value)
+        await self.builder.apply(interaction, add_cash)
+
+class TradeRemoveSelect(discord.ui.Select):
+    def __init__(self, builder: "TradeBuilderView", session: TradeSession):
+        options = []
+        for side, label in [("offer", "Offer"), ("counter", "Counter")]:
+            for index, entry in enumerate(getattr(session, f"{side}_items")):
+                options.append(discord.SelectOption(label=f"{label}: {entry.name}"[:100], value=f"{side}:{index}"))
+            if getattr(session, f"{side}_cash"):
+                options.append(discord.SelectOption(label=f"{label}: Cash", value=f"{side}:cash"))
+        super().__init__(placeholder="Remove an entry", options=options[:25], row=2)
+        self.builder = builder
+
+    async def callback(self, interaction: discord.Interaction):
+        side, index = self.values[0].split(":")
+
+        def remove(session: TradeSession):
+            if index == "cash":
+                setattr(session, f"{side}_cash", 0)
+            elif int(index) < len(getattr(session, f"{side}_items")):
+                session.remove_entry(side, int(index))
+        await self.builder.apply(interaction, remove)
+
+class TradeBuilderView(discord.ui.View):
+    def __init__(self, cog: "Trading", owner_id: int):
+        super().__init__(timeout=900)
+        self.cog = cog
+        self.owner_id = owner_id
+        self.remove_select: Optional[TradeRemoveSelect] = None
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.owner_id:
+            await interaction.response.send_message("This is not your trade.", ephemeral=True)
+            return False
+        return True
+
+    def refresh(self, session: TradeSession):
+        if self.remove_select is not None:
+            self.remove_item(self.remove_select)
+            self.remove_select = None
+        if session.offer_items or session.counter_items or session.offer_cash or session.counter_cash:
+            self.remove_select = TradeRemoveSelect(self, session)
+            self.add_item(self.remove_select)
+
+    def build_embed(self, session: TradeSession) -> discord.Embed:
+        cog = self.cog
+        offer_details = "".join(entry.line for entry in session.offer_items)
+        if session.offer_cash:
+            offer_details += f"\n> - **Cash:** {cog.format_cash(session.offer_cash)}"
+        counter_details = "".join(entry.line for entry in session.counter_items)
+        if session.counter_cash:
+            counter_details += f"\n> - **Cash:** {cog.format_cash(session.counter_cash)}"
+        total_offer_value = session.offer_total + session.offer_cash
+        total_counter_value = session.counter_total + session.counter_cash
+        if total_counter_value > total_offer_value:
+            running = f"Win by {cog.format_cash(total_counter_value - total_offer_value)}"
+        elif total_counter_value < total_offer_value:
+            running = f"Lose by {cog.format_cash(total_offer_value - total_counter_value)}"
+        else:
+            running = "Tie"
+        embed = discord.Embed(
+            title="Trade Builder <a:trade:1337503184444330025>",
+            description=(f"**Your offer:**{offer_details or ' -'}\n\n"
+                         f"**Counter offer:**{counter_details or ' -'}")[:4096],
+            color=discord.Color.blue()
+        )
+        embed.add_field(name="Your offer", value=cog.format_cash(total_offer_value), inline=True)
+        embed.add_field(name="Counter offer", value=cog.format_cash(total_counter_value), inline=True)
+        embed.add_field(name="Running result", value=running, inline=True)
+        return embed
+
+    async def apply(self, interaction: discord.Interaction, change):
+        
+        session = self.cog.get_session(self.owner_id)
+        if session is None:
+            await interaction.response.send_message("This trade has ended or expired. Start a new one with `/trade builder`.", ephemeral=True)
+            return
+        self.cog.reload_values_if_changed()
+        try:
+            change(session)
+        except ValueError as e:
+            await interaction.response.send_message(str(e), ephemeral=True)
+            return
+        self.refresh(session)
+        await interaction.response.edit_message(embed=self.build_embed(session), view=self)
+
+    @discord.ui.button(label="Offer item", style=discord.ButtonStyle.primary, row=0)
+    async def offer_item_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.send_modal(TradeItemModal(self, "offer"))
+
+    @discord.ui.button(label="Offer cash", style=discord.ButtonStyle.primary, row=0)
+    async def offer_cash_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.send_modal(TradeCashModal(self, "offer"))
+
+    @discord.ui.button(label="Counter item", style=discord.ButtonStyle.secondary, row=1)
+    async def counter_item_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.send_modal(TradeItemModal(self, "counter"))
+
+    @discord.ui.button(label="Counter cash", style=discord.ButtonStyle.secondary, row=1)
+    async def counter_cash_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await interaction.response.send_modal(TradeCashModal(self, "counter"))
+
+    @discord.ui.button(label="End trade", style=discord.ButtonStyle.success, row=0)
+    async def end_button(self, interaction: discord.Interaction, button: discord.ui.Button):
+        session = self.cog.get_session(self.owner_id)
+        if session is None:
+            await interaction.response.send_message("This trade has ended or expired. Start a new one with `/trade builder`.", ephemeral=True)
+            return
+        result_embed, ansi_message = self.cog.build_trade_result(session)
+        self.cog.end_session(self.owner_id)
+        self.stop()
+        await interaction.response.edit_message(embed=self.build_embed(session), view=None)
+        await interaction.followup.send(embed=result_embed)
+        await interaction.followup.send(ansi_message)
+        self.cog.update_uses(str(self.owner_id))
+        self.cog.record_trade(self.owner_id, session)
 
 class Trading(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
-        self.trades = {}
         
-        values_path = "/home/container/cogs/values.json"
-        if os.path.exists(values_path):
-            with open(values_path, "r", encoding="utf-8") as f:
-                self.values_data = json.load(f)
+        self.trades: "OrderedDict[int, TradeSession]" = OrderedDict()
+        self.trades_dirty = False
+        self.load_sessions()
+        self.trade_stats = {}
+        self.trade_stats_dirty = False
+        self.load_trade_stats()
+        
+        self.values_version = None
+        self.load_values()
+
+    def load_values(self):
+        if os.path.exists(VALUES_FILE):
+            try:
+                with open(VALUES_FILE, "r", encoding="utf-8") as f:
+                    values_data = json.load(f)
+                values_version = os.path.getmtime(VALUES_FILE)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Could not load values, keeping the previous catalog: {e}")
+                if not hasattr(self, "values_data"):
+                    self.values_data = {}
+                    self.values_version = None
+                    self.all_items = []
+                    self.item_lookup = {}
+                    self.balance_values = []
+                return
+            self.values_data = values_data
+            self.values_version = values_version
         else:
             self.values_data = {}
+            self.values_version = None
         
         self.all_items = []
         for group in ["items", "event_items", "miscellaneous_items", "kukri_items"]:
             if group in self.values_data:
                 self.all_items.extend(list(self.values_data[group].keys()))
+        self.item_lookup = {name.lower(): name for name in self.all_items}
+
+        
+        self.balance_values = self.build_value_array(self.all_items)
+
+    def build_value_array(self, item_names: List[str]) -> List[Tuple[int, str]]:
+        
+        values = []
+        for name in item_names:
+            try:
+                value = self.build_entry(name, None).value
+            except ValueError:
+                continue
+            if value > 0:
+                values.append((value, name))
+        values.sort()
+        return values
+
+    def reload_values_if_changed(self):
+        
+        try:
+            mtime = os.path.getmtime(VALUES_FILE)
+        except OSError:
+            return
+        if mtime != self.values_version:
+            self.load_values()
+
+    async def cog_load(self):
+        self.snapshot_sessions.start()
+
+    async def cog_unload(self):
+        self.snapshot_sessions.cancel()
+        self.save_sessions()
+        if self.trade_stats_dirty:
+            self.save_trade_stats()
+
+    def load_trade_stats(self):
+        try:
+            with open(TRADE_STATS_FILE, "r", encoding="utf-8") as f:
+                self.trade_stats = json.load(f)
+        except Exception:
+            self.trade_stats = {}
+        self.trade_stats.setdefault("trades", 0)
+        self.trade_stats.setdefault("outcomes", {"win": 0, "lose": 0, "tie": 0})
+        self.trade_stats.setdefault("margins", {"win": 0, "lose": 0})
+        self.trade_stats.setdefault("items", {})
+        self.trade_stats.setdefault("offset", 0)
+        
+        if os.path.exists(TRADE_HISTORY_FILE) and os.path.getsize(TRADE_HISTORY_FILE) > self.trade_stats["offset"]:
+            with open(TRADE_HISTORY_FILE, "rb") as f:
+                f.seek(self.trade_stats["offset"])
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        self.aggregate_trade(json.loads(line))
+                    except (ValueError, KeyError):
+                        pass
+                    self.trade_stats["offset"] += len(line)
+            self.save_trade_stats()
+
+    def save_trade_stats(self):
+        with open(TRADE_STATS_FILE, "w", encoding="utf-8") as f:
+            json.dump(self.trade_stats, f)
+        self.trade_stats_dirty = False
+
+    def aggregate_trade(self, record: dict):
+        stats = self.trade_stats
+        stats["trades"] += 1
+        stats["outcomes"][record["r"]] += 1
+        if record["r"] != "tie":
+            stats["margins"][record["r"]] += abs(record["ct"] - record["ot"])
+        for name, _ in record["o"] + record["c"]:
+            stats["items"][name] = stats["items"].get(name, 0) + 1
+
+    def record_trade(self, user_id: int, session: TradeSession):
+        
+        offer_total = session.offer_total + session.offer_cash
+        counter_total = session.counter_total + session.counter_cash
+        record = {
+            "u": user_id,
+            "t": int(time.time()),
+            "o": [[entry.name, entry.serial] for entry in session.offer_items],
+            "c": [[entry.name, entry.serial] for entry in session.counter_items],
+            "oc": session.offer_cash,
+            "cc": session.counter_cash,
+            "ot": offer_total,
+            "ct": counter_total,
+            "r": "win" if counter_total > offer_total else "lose" if counter_total < offer_total else "tie"
+        }
+        line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+        with open(TRADE_HISTORY_FILE, "ab") as f:
+            f.write(line)
+        self.aggregate_trade(record)
+        self.trade_stats["offset"] += len(line)
+        self.trade_stats_dirty = True
+
+    def load_sessions(self):
+        try:
+            with open(TRADES_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            data = {}
+        now = time.time()
+        for user_id, session_data in sorted(data.items(), key=lambda entry: entry[1].get("expires_at", 0)):
+            try:
+                session = TradeSession.from_dict(session_data)
+            except (KeyError, TypeError):
+                continue
+            if not session.expired(now):
+                self.trades[int(user_id)] = session
+        while len(self.trades) > MAX_TRADE_SESSIONS:
+            self.trades.popitem(last=False)
+
+    def save_sessions(self):
+        data = {str(user_id): session.to_dict() for user_id, session in self.trades.items()}
+        with open(TRADES_FILE, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        self.trades_dirty = False
+
+    def purge_expired_sessions(self):
+        now = time.time()
+        
+        while self.trades:
+            user_id, session = next(iter(self.trades.items()))
+            if not session.expired(now):
+                break
+            del self.trades[user_id]
+            self.trades_dirty = True
+
+    def start_session(self, user_id: int) -> TradeSession:
+        self.trades.pop(user_id, None)
+        session = TradeSession()
+        self.trades[user_id] = session
+        while len(self.trades) > MAX_TRADE_SESSIONS:
+            self.trades.popitem(last=False)
+        self.trades_dirty = True
+        return session
+
+    def get_session(self, user_id: int) -> Optional[TradeSession]:
+        session = self.trades.get(user_id)
+        if session is None:
+            return None
+        if session.expired(time.time()):
+            del self.trades[user_id]
+            self.trades_dirty = True
+            return None
+        session.touch()
+        self.trades.move_to_end(user_id)
+        self.trades_dirty = True
+        return session
+
+    def end_session(self, user_id: int) -> Optional[TradeSession]:
+        session = self.get_session(user_id)
+        if session is not None:
+            del self.trades[user_id]
+        return session
+
+    def session_metrics(self) -> dict:
+        self.purge_expired_sessions()
+        memory = sys.getsizeof(self.trades) + sum(session.memory_size() for session in self.trades.values())
+        return {"sessions": len(self.trades), "memory": memory}
+
+    @tasks.loop(seconds=30)
+    async def snapshot_sessions(self):
+        self.purge_expired_sessions()
+        if self.trades_dirty:
+            self.save_sessions()
+        if self.trade_stats_dirty:
+            self.save_trade_stats()
 
     def parse_cash(self, cash_str: str) -> int:
         cash_str = cash_str.strip().lower()
@@ -94,6 +529,222 @@ class Trading(commands.Cog):
         else:
             raise ValueError("No price information available.")
 
+    def build_entry(self, item: str, serial: Optional[int]) -> TradeEntry:
+        
+        category = self.get_item_category(item)
+        if not category:
+            raise ValueError("The specified item was not found.")
+        if category in ["event_items", "miscellaneous_items"]:
+            if serial is not None:
+                raise ValueError("You cannot add a serial for an event/miscellaneous item.")
+            serial_value = None
+            auto_serial = False
+        elif category in ["items", "kukri_items"]:
+            if serial is None:
+                serial_value = 75000
+                auto_serial = True
+            else:
+                serial_value = serial
+                auto_serial = False
+        else:
+            raise ValueError("Unknown item category.")
+
+        value = self.get_item_value(item, serial_value)
+        note = " (high serial)" if auto_serial else ""
+        line = f"\n> - **{item}{note}** (value: {self.format_cash(value)})"
+        return TradeEntry(item, serial_value, auto_serial, value, self.values_version, line)
+
+    def describe_stale_entries(self, session: TradeSession) -> Optional[str]:
+        
+        changes = []
+        for entry in session.offer_items + session.counter_items:
+            if entry.version == self.values_version:
+                continue
+            try:
+                current = self.get_item_value(entry.name, entry.serial)
+            except ValueError:
+                changes.append(f"- {entry.name}: {self.format_cash(entry.value)} -> no longer listed")
+                continue
+            if current != entry.value:
+                changes.append(f"- {entry.name}: {self.format_cash(entry.value)} -> {self.format_cash(current)}")
+        if not changes:
+            return None
+        text = "The values list changed after some items were added. The result uses the values from when each item was added."
+        text += "\n" + "\n".join(changes[:10])
+        return text[:1024]
+
+    def search_balance(self, values: List[Tuple[int, str]], target: int, tolerance: float, allow_repeats: bool) -> List[Tuple[int, Tuple[str, ...]]]:
+        
+        keys = [value for value, _ in values]
+        low = target * (1 - tolerance)
+        high = target * (1 + tolerance)
+        deadline = time.perf_counter() + BALANCE_TIME_BUDGET
+        step = 0 if allow_repeats else 1
+        best = {}
+
+        def consider(indices: Tuple[int, ...]):
+            total = sum(keys[i] for i in indices)
+            if low <= total <= high:
+                names = tuple(sorted(values[i][1] for i in indices))
+                best[names] = total
+
+        def closest(remainder: int, start: int):
+            pos = bisect.bisect_left(keys, remainder, lo=start)
+            return [i for i in (pos - 1, pos) if start <= i < len(keys)]
+
+        for i in closest(target, 0):
+            consider((i,))
+        for i in range(len(keys)):
+            if time.perf_counter() > deadline:
+                break
+            if i + step >= len(keys) or keys[i] + keys[i + step] > high:
+                break
+            for j in closest(target - keys[i], i + step):
+                consider((i, j))
+            if BALANCE_MAX_ITEMS < 3:
+                continue
+            for j in range(i + step, len(keys)):
+                if j + step >= len(keys) or keys[i] + keys[j] + keys[j + step] > high:
+                    break
+                for k in closest(target - keys[i] - keys[j], j + step):
+                    consider((i, j, k))
+
+        return heapq.nsmallest(
+            BALANCE_SUGGESTIONS,
+            ((total, names) for names, total in best.items()),
+            key=lambda entry: (abs(entry[0] - target), len(entry[1]))
+        )
+
+    def match_item(self, text: str) -> str:
+        
+        query = " ".join(text.lower().split())
+        if query in self.item_lookup:
+            return self.item_lookup[query]
+        detection = self.bot.get_cog("MessageDetection") if self.bot else None
+        if detection is not None:
+            alias = detection.alias_mapping.get(query)
+            if alias in self.all_items:
+                return alias
+        candidates = [name for name in self.all_items if query in name.lower()]
+        if len(candidates) == 1:
+            return candidates[0]
+        if len(candidates) > 1:
+            prefixed = [name for name in candidates if name.lower().startswith(query)]
+            if len(prefixed) == 1:
+                return prefixed[0]
+            shown = ", ".join(candidates[:5]) + (", ..." if len(candidates) > 5 else "")
+            raise ValueError(f"`{text}` matches several items: {shown}")
+        raise ValueError(f"`{text}` is not a known item.")
+
+    def parse_trade_line(self, text: str) -> Tuple[List[TradeEntry], int, List[str]]:
+        
+        entries = []
+        cash = 0
+        errors = []
+        for token in text.split(","):
+            token = token.strip()
+            if not token:
+                continue
+            try:
+                cash += self.parse_cash(token)
+                continue
+            except ValueError:
+                pass
+            try:
+                quantity = 1
+                name = token
+                match = re.match(r"^(\d+)\s*x\s+(.+)$", token, re.IGNORECASE) or re.match(r"^(.+?)\s+x(\d+)$", token, re.IGNORECASE)
+                if match:
+                    if match.group(1).isdigit():
+                        quantity, name = int(match.group(1)), match.group(2)
+                    else:
+                        name, quantity = match.group(1), int(match.group(2))
+                if not 1 <= quantity <= MAX_ITEM_QUANTITY:
+                    raise ValueError(f"`{token}`: quantity must be between 1 and {MAX_ITEM_QUANTITY}.")
+                serial = None
+                try:
+                    item = self.match_item(name)
+                except ValueError:
+                    match = re.match(r"^(.+?)\s+#?(\d+)$", name)
+                    if not match:
+                        raise
+                    item = self.match_item(match.group(1))
+                    serial = int(match.group(2))
+                entry = self.build_entry(item, serial)
+            except ValueError as e:
+                message = str(e)
+                errors.append(message if message.startswith("`") else f"`{token}`: {message}")
+                continue
+            entries.extend([entry] * quantity)
+        return entries, cash, errors
+
+    def build_trade_result(self, session: TradeSession) -> Tuple[discord.Embed, str]:
+        offer_items = session.offer_items
+        counter_items = session.counter_items
+        offer_cash = session.offer_cash
+        counter_cash = session.counter_cash
+
+        offer_details = "".join(entry.line for entry in offer_items)
+        if offer_cash:
+            offer_details += f"\n> - **Cash:** {self.format_cash(offer_cash)}"
+        counter_details = "".join(entry.line for entry in counter_items)
+        if counter_cash:
+            counter_details += f"\n> - **Cash:** {self.format_cash(counter_cash)}"
+        total_offer_value = session.offer_total + offer_cash
+        total_counter_value = session.counter_total + counter_cash
+
+        result_embed = discord.Embed(
+            title="Trade Result <a:trade:1337503184444330025>",
+            description=(f"**Your offer:**{offer_details}\n\n"
+                         f"**Counter offer:**{counter_details}"),
+            color=discord.Color.blue()
+        )
+        self.reload_values_if_changed()
+        stale = self.describe_stale_entries(session) if session.versions - {self.values_version} else None
+        if stale:
+            result_embed.add_field(
+                name="Values updated during this trade",
+                value=stale,
+                inline=False
+            )
+        result_embed.set_footer(text="Powered by Gold Rush Trading", icon_url="https://discord.gg/45J959xRzJ")
+
+        if total_counter_value > total_offer_value:
+            diff = total_counter_value - total_offer_value
+            ansi_message = (
+                "```ansi\n"
+                "\u001b[1;2mResult:\n"
+                "\u001b[0;2m\u001b[1;32mWin by " + self.format_cash(diff) +
+                "\u001b[0m\n"
+                "```"
+            )
+        elif total_counter_value < total_offer_value:
+            diff = total_offer_value - total_counter_value
+            ansi_message = (
+                "```ansi\n"
+                "\u001b[1;2mResult:\n"
+                "\u001b[1;31mLose by " + self.format_cash(diff) +
+                "\u001b[0m\n"
+                "```"
+            )
+        else:
+            ansi_message = (
+                "```ansi\n"
+                "\u001b[1;2mResult:\n"
+                "\u001b[1;33mTie - Both offers are equal\u001b[0m\n"
+                "```"
+            )
+        return result_embed, ansi_message
+
+    def is_blacklisted(self, user_id: int) -> bool:
+        blacklist_path = "/home/container/blacklist.json"
+        try:
+            with open(blacklist_path, "r", encoding="utf-8") as f:
+                blacklist = json.load(f)
+        except Exception:
+            blacklist = []
+        return str(user_id) in blacklist
+
     async def autocomplete_items(self, interaction: discord.Interaction, current: str):
         current = current.lower()
         suggestions = [
@@ -126,13 +777,7 @@ class Trading(commands.Cog):
     @trade.command(name="start", description="Start a trade")
     async def trade_start(self, interaction: discord.Interaction):
         
-        blacklist_path = "/home/container/blacklist.json"
-        try:
-            with open(blacklist_path, "r", encoding="utf-8") as f:
-                blacklist = json.load(f)
-        except Exception:
-            blacklist = []
-        if str(interaction.user.id) in blacklist:
+        if self.is_blacklisted(interaction.user.id):
             embed = discord.Embed(
                 title="Blacklisted! <a:warning:1337122473879277580>",
                 description="You have been blacklisted. Open a ticket in [Gold Rush Trading](https://discord.gg/45J959xRzJ) to appeal.",
@@ -141,12 +786,7 @@ class Trading(commands.Cog):
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        self.trades[interaction.user.id] = {
-            "offer_items": [],
-            "offer_cash": 0,
-            "counter_items": [],
-            "counter_cash": 0
-        }
+        self.start_session(interaction.user.id)
         embed = discord.Embed(
             title="Trade Started",
             description=("Trade started. Use `/offer item` and `/offer cash` to add items or cash to your offer.\n"
@@ -156,9 +796,26 @@ class Trading(commands.Cog):
         )
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
+    @trade.command(name="builder", description="Build a trade in a single message")
+    async def trade_builder(self, interaction: discord.Interaction):
+        if self.is_blacklisted(interaction.user.id):
+            embed = discord.Embed(
+                title="Blacklisted! <a:warning:1337122473879277580>",
+                description="You have been blacklisted. Open a ticket in [Gold Rush Trading](https://discord.gg/45J959xRzJ) to appeal.",
+                color=discord.Color.red()
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+
+        self.reload_values_if_changed()
+        session = self.start_session(interaction.user.id)
+        view = TradeBuilderView(self, interaction.user.id)
+        await interaction.response.send_message(embed=view.build_embed(session), view=view, ephemeral=True)
+
     @trade.command(name="end", description="End the trade and display the result")
     async def trade_end(self, interaction: discord.Interaction):
-        if interaction.user.id not in self.trades:
+        session = self.get_session(interaction.user.id)
+        if session is None:
             embed = discord.Embed(
                 title="Error",
                 description="No active trade session found.",
@@ -167,133 +824,143 @@ class Trading(commands.Cog):
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        session = self.trades.pop(interaction.user.id)
-        offer_items = session["offer_items"]
-        counter_items = session["counter_items"]
-        offer_cash = session["offer_cash"]
-        counter_cash = session["counter_cash"]
+        result_embed, ansi_message = self.build_trade_result(session)
+        self.end_session(interaction.user.id)
+        await interaction.response.send_message(embed=result_embed)
+        await interaction.followup.send(ansi_message)
+        self.update_uses(str(interaction.user.id))
+        self.record_trade(interaction.user.id, session)
 
-        offer_details = ""
-        counter_details = ""
-        total_offer_value = offer_cash
-        total_counter_value = counter_cash
+    @trade.command(name="stats", description="Show statistics of finished trades")
+    async def trade_stats_command(self, interaction: discord.Interaction):
+        stats = self.trade_stats
+        if not stats["trades"]:
+            await interaction.response.send_message("No trades have been finished yet.", ephemeral=True)
+            return
 
-        for item in offer_items:
-            try:
-                value = self.get_item_value(item["name"], item["serial"])
-            except Exception:
-                value = 0
-            total_offer_value += value
-            note = " (high serial)" if item.get("auto_serial", False) else ""
-            offer_details += f"\n> - **{item['name']}{note}** (value: {self.format_cash(value)})"
-        if offer_cash:
-            offer_details += f"\n> - **Cash:** {self.format_cash(offer_cash)}"
+        outcomes = stats["outcomes"]
+        embed = discord.Embed(title="Trade Statistics <a:trade:1337503184444330025>", color=discord.Color.blue())
+        embed.add_field(name="Trades", value=str(stats["trades"]), inline=False)
+        embed.add_field(name="Wins", value=str(outcomes["win"]), inline=True)
+        embed.add_field(name="Losses", value=str(outcomes["lose"]), inline=True)
+        embed.add_field(name="Ties", value=str(outcomes["tie"]), inline=True)
+        for outcome, label in [("win", "Average win"), ("lose", "Average loss")]:
+            average = stats["margins"][outcome] // outcomes[outcome] if outcomes[outcome] else 0
+            embed.add_field(name=label, value=self.format_cash(average), inline=True)
+        top_items = heapq.nlargest(10, stats["items"].items(), key=lambda entry: entry[1])
+        if top_items:
+            embed.add_field(
+                name="Most traded items",
+                value="\n".join(f"{rank}. {name} ({count})" for rank, (name, count) in enumerate(top_items, start=1)),
+                inline=False
+            )
+        embed.set_footer(text="Powered by Gold Rush Trading", icon_url="https://discord.gg/45J959xRzJ")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
 
-        for item in counter_items:
+    @trade.command(name="balance", description="Find items that make up a trade difference")
+    @app_commands.describe(
+        amount="Difference to cover (e.g. 1.2M). Defaults to the difference of your active trade",
+        inventory="Only use these items, separated by commas",
+        tolerance="Allowed deviation in percent (default 10)"
+    )
+    async def trade_balance(self, interaction: discord.Interaction, amount: Optional[str] = None, inventory: Optional[str] = None, tolerance: app_commands.Range[int, 0, 50] = 10):
+        if amount is not None:
             try:
-                value = self.get_item_value(item["name"], item["serial"])
-            except Exception:
-                value = 0
-            total_counter_value += value
-            note = " (high serial)" if item.get("auto_serial", False) else ""
-            counter_details += f"\n> - **{item['name']}{note}** (value: {self.format_cash(value)})"
-        if counter_cash:
-            counter_details += f"\n> - **Cash:** {self.format_cash(counter_cash)}"
-
-        result_embed = discord.Embed(
-            title="Trade Result <a:trade:1337503184444330025>",
-            description=(f"**Your offer:**{offer_details}\n\n"
-                         f"**Counter offer:**{counter_details}"),
-            color=discord.Color.blue()
-        )
-        result_embed.set_footer(text="Powered by Gold Rush Trading", icon_url="https://discord.gg/45J959xRzJ")
-        await interaction.response.send_message(embed=result_embed)
+                target = self.parse_cash(amount)
+            except ValueError as e:
+                embed = discord.Embed(title="Error", description=str(e), color=discord.Color.red())
+                await interaction.response.send_message(embed=embed, ephemeral=True)
+                return
+        else:
+            session = self.get_session(interaction.user.id)
+            if session is None:
+                embed = discord.Embed(
+                    title="Error",
+                    description="Provide an amount or start a trade using `/trade start`.",
+                    color=discord.Color.red()
+                )
+                await interaction.response.send_message(embed=embed, ephemeral=True)
+                return
+            target = abs((session.offer_total + session.offer_cash) - (session.counter_total + session.counter_cash))
+        if target <= 0:
+            await interaction.response.send_message("There is no difference to balance.", ephemeral=True)
+            return
 
-        if total_counter_value > total_offer_value:
-            diff = total_counter_value - total_offer_value
-            ansi_message = (
-                "```ansi\n"
-                "\u001b[1;2mResult:\n"
-                "\u001b[0;2m\u001b[1;32mWin by " + self.format_cash(diff) +
-                "\u001b[0m\n"
-                "```"
-            )
-        elif total_counter_value < total_offer_value:
-            diff = total_offer_value - total_counter_value
-            ansi_message = (
-                "```ansi\n"
-                "\u001b[1;2mResult:\n"
-                "\u001b[1;31mLose by " + self.format_cash(diff) +
-                "\u001b[0m\n"
-                "```"
-            )
+        self.reload_values_if_changed()
+        if inventory:
+            names = []
+            unknown = []
+            for token in inventory.split(","):
+                token = token.strip()
+                if not token:
+                    continue
+                try:
+                    names.append(self.match_item(token))
+                except ValueError as e:
+                    unknown.append(str(e))
+            if unknown:
+                embed = discord.Embed(
+                    title="Error",
+                    description="\n".join(unknown),
+                    color=discord.Color.red()
+                )
+                await interaction.response.send_message(embed=embed, ephemeral=True)
+                return
+            values = self.build_value_array(names)
+            suggestions = self.search_balance(values, target, tolerance / 100, allow_repeats=False)
         else:
-            ansi_message = (
-                "```ansi\n"
-                "\u001b[1;2mResult:\n"
-                "\u001b[1;33mTie - Both offers are equal\u001b[0m\n"
-                "```"
-            )
-        await interaction.followup.send(ansi_message)
-        self.update_uses(str(interaction.user.id))
+            suggestions = self.search_balance(self.balance_values, target, tolerance / 100, allow_repeats=True)
 
-    @offer.command(name="item", description="Add an item to your offer")
-    async def offer_item(self, interaction: discord.Interaction, item: str, serial: Optional[int] = None):
-        if interaction.user.id not in self.trades:
+        if not suggestions:
             embed = discord.Embed(
-                title="Error",
-                description="No active trade session found. Start a trade using `/trade start`.",
+                title="No Suggestions",
+                description=f"No combination of up to {BALANCE_MAX_ITEMS} items is within {tolerance}% of {self.format_cash(target)}.",
                 color=discord.Color.red()
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        category = self.get_item_category(item)
-        if not category:
+        desc = ""
+        for total, names in suggestions:
+            deviation = (total - target) / target * 100
+            desc += f"- {' + '.join(names)} = **{self.format_cash(total)}** ({'+' if deviation >= 0 else ''}{round(deviation)}%)\n"
+        embed = discord.Embed(
+            title=f"Ways to balance {self.format_cash(target)}",
+            description=desc,
+            color=discord.Color.blue()
+        )
+        embed.set_footer(text="Serial items are valued as high serials.")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @offer.command(name="item", description="Add an item to your offer")
+    async def offer_item(self, interaction: discord.Interaction, item: str, serial: Optional[int] = None):
+        session = self.get_session(interaction.user.id)
+        if session is None:
             embed = discord.Embed(
                 title="Error",
-                description="The specified item was not found.",
+                description="No active trade session found. Start a trade using `/trade start`.",
                 color=discord.Color.red()
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        if category in ["event_items", "miscellaneous_items"]:
-            if serial is not None:
-                embed = discord.Embed(
-                    title="Error",
-                    description="You cannot add a serial for an event/miscellaneous item.",
-                    color=discord.Color.red()
-                )
-                await interaction.response.send_message(embed=embed, ephemeral=True)
-                return
-            serial_value = None
-            auto_serial = False
-        elif category in ["items", "kukri_items"]:
-            if serial is None:
-                serial_value = 75000
-                auto_serial = True
-            else:
-                serial_value = serial
-                auto_serial = False
-        else:
+        self.reload_values_if_changed()
+        try:
+            entry = self.build_entry(item, serial)
+        except ValueError as e:
             embed = discord.Embed(
                 title="Error",
-                description="Unknown item category.",
+                description=str(e),
                 color=discord.Color.red()
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        self.trades[interaction.user.id]["offer_items"].append({
-            "name": item,
-            "serial": serial_value,
-            "auto_serial": auto_serial
-        })
-        note_text = " (high serial)" if auto_serial else ""
+        session.add_entry("offer", entry)
+        note_text = " (high serial)" if entry.auto_serial else ""
         embed = discord.Embed(
             title="Item Added",
-            description=f"{item}{note_text} with serial {serial_value if serial_value is not None else 'N/A'} has been added to your offer.",
+            description=f"{item}{note_text} with serial {entry.serial if entry.serial is not None else 'N/A'} has been added to your offer.",
             color=discord.Color.green()
         )
         await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -304,7 +971,8 @@ class Trading(commands.Cog):
 
     @offer.command(name="cash", description="Add cash to your offer")
     async def offer_cash(self, interaction: discord.Interaction, amount: str):
-        if interaction.user.id not in self.trades:
+        session = self.get_session(interaction.user.id)
+        if session is None:
             embed = discord.Embed(
                 title="Error",
                 description="No active trade session found. Start a trade using `/trade start`.",
@@ -319,7 +987,7 @@ class Trading(commands.Cog):
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        self.trades[interaction.user.id]["offer_cash"] += cash_value
+        session.offer_cash += cash_value
         embed = discord.Embed(
             title="Cash Added",
             description=f"{self.format_cash(cash_value)} has been added to your offer.",
@@ -329,7 +997,8 @@ class Trading(commands.Cog):
 
     @counter.command(name="item", description="Add an item to the counter offer")
     async def counter_item(self, interaction: discord.Interaction, item: str, serial: Optional[int] = None):
-        if interaction.user.id not in self.trades:
+        session = self.get_session(interaction.user.id)
+        if session is None:
             embed = discord.Embed(
                 title="Error",
                 description="No active trade session found. Start a trade using `/trade start`.",
@@ -338,52 +1007,23 @@ class Trading(commands.Cog):
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        category = self.get_item_category(item)
-        if not category:
-            embed = discord.Embed(
-                title="Error",
-                description="The specified item was not found.",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
-            return
-
-        if category in ["event_items", "miscellaneous_items"]:
-            if serial is not None:
-                embed = discord.Embed(
-                    title="Error",
-                    description="You cannot add a serial for an event/miscellaneous item.",
-                    color=discord.Color.red()
-                )
-                await interaction.response.send_message(embed=embed, ephemeral=True)
-                return
-            serial_value = None
-            auto_serial = False
-        elif category in ["items", "kukri_items"]:
-            if serial is None:
-                serial_value = 75000
-                auto_serial = True
-            else:
-                serial_value = serial
-                auto_serial = False
-        else:
+        self.reload_values_if_changed()
+        try:
+            entry = self.build_entry(item, serial)
+        except ValueError as e:
             embed = discord.Embed(
                 title="Error",
-                description="Unknown item category.",
+                description=str(e),
                 color=discord.Color.red()
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        self.trades[interaction.user.id]["counter_items"].append({
-            "name": item,
-            "serial": serial_value,
-            "auto_serial": auto_serial
-        })
-        note_text = " (high serial)" if auto_serial else ""
+        session.add_entry("counter", entry)
+        note_text = " (high serial)" if entry.auto_serial else ""
         embed = discord.Embed(
             title="Item Added",
-            description=f"{item}{note_text} with serial {serial_value if serial_value is not None else 'N/A'} has been added to the counter offer.",
+            description=f"{item}{note_text} with serial {entry.serial if entry.serial is not None else 'N/A'} has been added to the counter offer.",
             color=discord.Color.green()
         )
         await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -394,7 +1034,8 @@ class Trading(commands.Cog):
 
     @counter.command(name="cash", description="Add cash to the counter offer")
     async def counter_cash(self, interaction: discord.Interaction, amount: str):
-        if interaction.user.id not in self.trades:
+        session = self.get_session(interaction.user.id)
+        if session is None:
             embed = discord.Embed(
                 title="Error",
                 description="No active trade session found. Start a trade using `/trade start`.",
@@ -409,7 +1050,7 @@ class Trading(commands.Cog):
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
 
-        self.trades[interaction.user.id]["counter_cash"] += cash_value
+        session.counter_cash += cash_value
         embed = discord.Embed(
             title="Cash Added",
             description=f"{self.format_cash(cash_value)} has been added to the counter offer.",
@@ -417,6 +1058,49 @@ class Trading(commands.Cog):
         )
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
+    async def add_items_from_text(self, interaction: discord.Interaction, side: str, items: str):
+        session = self.get_session(interaction.user.id)
+        if session is None:
+            embed = discord.Embed(
+                title="Error",
+                description="No active trade session found. Start a trade using `/trade start`.",
+                color=discord.Color.red()
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            return
+
+        self.reload_values_if_changed()
+        entries, cash, errors = self.parse_trade_line(items)
+        for entry in entries:
+            session.add_entry(side, entry)
+        setattr(session, f"{side}_cash", getattr(session, f"{side}_cash") + cash)
+
+        target = "your offer" if side == "offer" else "the counter offer"
+        desc = "".join(entry.line for entry in entries)
+        if cash:
+            desc += f"\n> - **Cash:** {self.format_cash(cash)}"
+        embed = discord.Embed(
+            title="Items Added" if entries or cash else "Nothing Added",
+            description=f"Added to {target}:{desc}" if desc else f"Nothing was added to {target}.",
+            color=discord.Color.green() if entries or cash else discord.Color.red()
+        )
+        if errors:
+            shown = "\n".join(errors[:10])
+            if len(errors) > 10:
+                shown += f"\n... and {len(errors) - 10} more"
+            embed.add_field(name="Not added", value=shown[:1024], inline=False)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @offer.command(name="items", description="Add several items or cash to your offer, separated by commas")
+    @app_commands.describe(items="e.g. lanc 55, 2x cursed, proto, 1.5m")
+    async def offer_items(self, interaction: discord.Interaction, items: str):
+        await self.add_items_from_text(interaction, "offer", items)
+
+    @counter.command(name="items", description="Add several items or cash to the counter offer, separated by commas")
+    @app_commands.describe(items="e.g. lanc 55, 2x cursed, proto, 1.5m")
+    async def counter_items(self, interaction: discord.Interaction, items: str):
+        await self.add_items_from_text(interaction, "counter", items)
+
 async def setup(bot: commands.Bot):
     await bot.add_cog(Trading(bot))
 